@@ -32,7 +32,6 @@ __license__ = "MIT"
 
 from repo_to_pdf.core.config import AppConfig
 from repo_to_pdf.core.exceptions import RepoPDFError
-from repo_to_pdf.converter import RepoPDFConverter
 
 __all__ = [
     "AppConfig",
@@ -40,3 +39,17 @@ __all__ = [
     "RepoPDFError",
     "__version__",
 ]
+
+
+def __getattr__(name: str):
+    """
+    Import RepoPDFConverter on first access.
+
+    The converter pulls in GitPython, requests and the image stack, which
+    the CLI does not need for --help or argument errors.
+    """
+    if name == "RepoPDFConverter":
+        from repo_to_pdf.converter import RepoPDFConverter
+
+        return RepoPDFConverter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
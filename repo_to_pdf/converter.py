@@ -1,24 +1,171 @@
 """Main PDF converter coordinating all components."""
 
+import hashlib
 import logging
 import os
+import shutil
 import subprocess
+import threading
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import IO, BinaryIO, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from tqdm import tqdm
 
 from repo_to_pdf.converters import EmojiHandler, ImageConverter, LaTeXGenerator
 from repo_to_pdf.core.config import AppConfig
-from repo_to_pdf.core.constants import CODE_EXTENSIONS, IMAGE_EXTENSIONS
+from repo_to_pdf.core.constants import (
+    ALLOWED_HIDDEN_FILES,
+    CODE_EXTENSIONS,
+    DEDUP_MIN_BYTES,
+    IMAGE_EXTENSIONS,
+    MAX_CONCURRENT_FILES,
+    OUTPUT_FLUSH_BYTES,
+    PANDOC_OUTPUT_TAIL_LINES,
+    PANDOC_TOC_DEPTH,
+    RENDER_CACHE_MAX_AGE_DAYS,
+    XELATEX_MEMORY_ENV,
+)
 from repo_to_pdf.core.exceptions import ConversionError, GitOperationError
 from repo_to_pdf.git.repo_manager import GitRepoManager
-from repo_to_pdf.processors import CodeProcessor, FileProcessor, MarkdownProcessor
+from repo_to_pdf.processors import (
+    CodeProcessor,
+    FileProcessor,
+    MarkdownProcessor,
+    RenderCache,
+)
+from repo_to_pdf.processors.markdown_processor import (
+    _REMOTE_HTML_IMAGE_RE,
+    _REMOTE_MD_IMAGE_RE,
+)
 from repo_to_pdf.stats import CodeStatsGenerator, DirectoryTreeGenerator
 
 logger = logging.getLogger(__name__)
 
+# Lowercased extensions that _process_single_file() renders; anything else
+# is dropped during the walk without being stat'ed or dispatched
+_PROCESSED_EXTENSIONS = (
+    frozenset(CODE_EXTENSIONS) | IMAGE_EXTENSIONS | frozenset({".md", ".mdx", ".html"})
+)
+
+# Rendered Markdown for one file: text, or a render cache entry to splice in
+Fragment = Union[str, Path]
+
+# Rendered output containing these references depends on files generated
+# into the per-run temp directory, so it is never served from the cache
+_UNCACHEABLE_OUTPUT_MARKERS = ("images/", "emojiimg")
+
+# Pandoc arguments that do not depend on the run; reader format, engine and
+# highlighting come from the defaults file written by LaTeXGenerator
+_PANDOC_STATIC_ARGS = (
+    "--toc",
+    f"--toc-depth={PANDOC_TOC_DEPTH}",
+    "-V",
+    "date=\\today",
+)
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """
+    Hardlink src to dst, falling back to a copy.
+
+    The temp directory normally lives on the same filesystem as the
+    workspace, so a hardlink avoids copying image bytes. Cross-device
+    targets and filesystems without hardlink support use shutil.copy2.
+
+    Args:
+        src: Source file
+        dst: Destination path (replaced if it already exists)
+    """
+    try:
+        if dst.exists():
+            dst.unlink()
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _append_file(src: Path, out_file: BinaryIO) -> None:
+    """
+    Append the contents of a file to a binary output file.
+
+    Uses os.sendfile() where available so the bytes are copied inside the
+    kernel, falling back to a buffered userspace copy.
+
+    Args:
+        src: File to append
+        out_file: Buffered binary output file
+    """
+    with open(src, "rb") as in_file:
+        offset = 0
+        if hasattr(os, "sendfile"):
+            size = os.fstat(in_file.fileno()).st_size
+            # Pending buffered bytes must reach the file before splicing
+            out_file.flush()
+            try:
+                while offset < size:
+                    sent = os.sendfile(
+                        out_file.fileno(), in_file.fileno(), offset, size - offset
+                    )
+                    if sent == 0:
+                        break
+                    offset += sent
+                return
+            except OSError as e:
+                logger.debug(f"sendfile failed for {src}, copying instead: {e}")
+
+        in_file.seek(offset)
+        shutil.copyfileobj(in_file, out_file, 1 << 20)
+
+
+# Converter owned by a process-pool worker, built once by _init_file_worker()
+_worker_converter: Optional["RepoPDFConverter"] = None
+
+
+def _init_file_worker(
+    config: AppConfig, repo_path: Path, file_sizes: Dict[Path, int]
+) -> None:
+    """
+    Set up a worker process for rendering files.
+
+    Args:
+        config: Application configuration
+        repo_path: Repository being converted
+        file_sizes: File sizes recorded by the parent's directory walk
+    """
+    global _worker_converter
+    _worker_converter = RepoPDFConverter(config)
+    _worker_converter.repo_path = repo_path
+    _worker_converter._file_sizes = file_sizes
+
+
+def _process_file_in_worker(file_path: Path) -> Tuple[List[Fragment], Optional[bytes]]:
+    """Render one file in a worker process (see RepoPDFConverter._process_file_safe)."""
+    return _worker_converter._process_file_safe(file_path)
+
+
+def _drain_stream(stream: IO[bytes], tail: Deque[bytes], label: str) -> None:
+    """
+    Read a subprocess pipe to EOF, keeping only its last lines.
+
+    Lines are kept as raw bytes; they are only decoded for debug logging
+    or when the caller reports an error.
+
+    Args:
+        stream: Binary pipe to read
+        tail: Bounded deque that receives the lines
+        label: Stream name used in debug logs
+    """
+    debug = logger.isEnabledFor(logging.DEBUG)
+    with stream:
+        for line in stream:
+            tail.append(line)
+            if debug:
+                text = line.decode("utf-8", "replace").rstrip()
+                logger.debug(f"pandoc {label}: {text}")
+
 
 class RepoPDFConverter:
     """
@@ -43,7 +190,7 @@ class RepoPDFConverter:
         # Initialize directories
         self.workspace_dir = config.workspace_path
         self.output_dir = config.output_path
-        self.temp_dir = config.project_root / "temp_conversion_files"
+        self.temp_dir = config.temp_path
 
         # Create directories
         self.workspace_dir.mkdir(parents=True, exist_ok=True)
@@ -56,7 +203,9 @@ class RepoPDFConverter:
 
         # Initialize components
         self.file_processor = FileProcessor(config)
-        self.image_converter = ImageConverter(self.images_dir)
+        self.image_converter = ImageConverter(
+            self.images_dir, max_raster_width=config.pdf_settings.svg_max_width
+        )
         self.emoji_handler = EmojiHandler(
             self.images_dir, enable_download=config.pdf_settings.emoji_download
         )
@@ -67,11 +216,18 @@ class RepoPDFConverter:
             config.ignores, max_depth=config.pdf_settings.tree_max_depth
         )
         self.stats_generator = CodeStatsGenerator(config.ignores)
+        self.render_cache = RenderCache(
+            self.workspace_dir / ".cache" / "render",
+            config.pdf_settings.model_dump_json(),
+        )
 
         # Repository manager (initialized in convert())
         self.repo_manager: Optional[GitRepoManager] = None
         self.repo_path: Optional[Path] = None
 
+        # File sizes from the directory walk, so files are not stat()ed again
+        self._file_sizes: Dict[Path, int] = {}
+
     def convert(self) -> Path:
         """
         Convert repository to PDF.
@@ -92,6 +248,10 @@ class RepoPDFConverter:
             temp_md = self._generate_markdown()
             logger.info(f"Generated Markdown: {temp_md}")
 
+            # Entries used by this run were refreshed; drop long-unused ones
+            if self.config.pdf_settings.render_cache:
+                self.render_cache.prune(RENDER_CACHE_MAX_AGE_DAYS)
+
             # Step 3: Generate LaTeX configuration
             pandoc_config = self.latex_generator.generate_pandoc_config(
                 self.repo_path.name
@@ -123,7 +283,12 @@ class RepoPDFConverter:
                 self.config.repository.url, self.config.repository.branch
             )
 
-            repo_path = self.repo_manager.clone_or_pull(self.workspace_dir)
+            sparse_excludes = (
+                self.config.ignores if self.config.repository.sparse_checkout else None
+            )
+            repo_path = self.repo_manager.clone_or_pull(
+                self.workspace_dir, sparse_excludes=sparse_excludes
+            )
             return repo_path
 
         except Exception as e:
@@ -141,63 +306,115 @@ class RepoPDFConverter:
         """
         temp_md = self.temp_dir / "temp.md"
 
-        with open(temp_md, "w", encoding="utf-8") as out_file:
+        # Binary mode with a large buffer: text is encoded once per fragment
+        # instead of going through the TextIOWrapper encoder on every write
+        with open(temp_md, "wb", buffering=1 << 20) as out_file:
             # Write title
-            out_file.write(f"# {self.repo_path.name} 代码文档\n\n")
+            out_file.write(f"# {self.repo_path.name} 代码文档\n\n".encode("utf-8"))
 
             # Generate directory tree
             if self.config.pdf_settings.include_tree:
                 logger.info("Generating directory tree...")
                 tree = self.tree_generator.generate_tree(self.repo_path)
-                out_file.write(tree)
-                out_file.write("\n\n")
+                out_file.write(tree.encode("utf-8"))
+                out_file.write(b"\n\n")
 
             # Generate code statistics
             if self.config.pdf_settings.include_stats:
                 logger.info("Generating code statistics...")
                 stats = self.stats_generator.generate_stats(self.repo_path)
-                out_file.write(stats)
-                out_file.write("\n\n")
+                out_file.write(stats.encode("utf-8"))
+                out_file.write(b"\n\n")
 
             # Process all files
             all_files = self._collect_files()
             logger.info(f"Processing {len(all_files)} files...")
 
-            for file_path in tqdm(
-                all_files,
-                desc="Processing files",
-                unit="file",
-                disable=logger.level > logging.INFO,
-            ):
-                try:
-                    content = self._process_single_file(file_path)
-                    if content:
-                        out_file.write(content)
-                        out_file.flush()  # Flush to avoid memory buildup
-                except Exception as e:
-                    logger.warning(f"Failed to process {file_path}: {e}")
-                    # Continue with other files
+            # First file seen for each content digest, for deduplication
+            seen_digests: Dict[bytes, Path] = {}
+
+            # Rendered text is batched so output is written in large chunks
+            pending = bytearray()
+
+            # Files are processed concurrently; map() yields results in input
+            # order so the document layout matches the sorted file list
+            executor, results = self._map_files(all_files)
+            with executor:
+                for file_path, (fragments, digest) in zip(
+                    all_files,
+                    tqdm(
+                        results,
+                        total=len(all_files),
+                        desc="Processing files",
+                        unit="file",
+                        disable=logger.level > logging.INFO,
+                    ),
+                ):
+                    # Replace later copies of identical content with a stub
+                    if digest is not None:
+                        first_path = seen_digests.setdefault(digest, file_path)
+                        if first_path != file_path:
+                            fragments = [self._duplicate_file_stub(file_path, first_path)]
+
+                    for fragment in fragments:
+                        if isinstance(fragment, Path):
+                            # Cache entries are spliced in, so flush text first
+                            if pending:
+                                out_file.write(pending)
+                                pending.clear()
+                            _append_file(fragment, out_file)
+                        else:
+                            pending += fragment.encode("utf-8")
+
+                    if len(pending) >= OUTPUT_FLUSH_BYTES:
+                        out_file.write(pending)
+                        pending.clear()
+
+            out_file.write(pending)
 
         # Final scrub: remove any remaining remote images to prevent Pandoc fetching
         try:
-            import re
             content = temp_md.read_text(encoding="utf-8")
             # Remove Markdown inline remote images
-            content = re.sub(
-                r"!\[[^\]]*\]\((https?://[^\s)]+)(\s+\"[^\"]*\")?\)",
-                "",
-                content,
-            )
+            content = _REMOTE_MD_IMAGE_RE.sub("", content)
             # Remove HTML remote images
-            content = re.sub(
-                r"<img[^>]+src=\"https?://[^\"]+\"[^>]*>", "", content, flags=re.IGNORECASE
-            )
+            content = _REMOTE_HTML_IMAGE_RE.sub("", content)
             temp_md.write_text(content, encoding="utf-8")
         except Exception as e:
             logger.warning(f"Final remote image scrub failed: {e}")
 
         return temp_md
 
+    def _map_files(
+        self, files: List[Path]
+    ) -> Tuple[Executor, Iterable[Tuple[List[Fragment], Optional[bytes]]]]:
+        """
+        Start rendering files concurrently.
+
+        Threads are used by default: most time is spent in file I/O and
+        subprocesses, and workers share the image and emoji caches. With
+        parallel_processes, files are rendered in a process pool so the
+        regex-heavy Markdown and code processing runs on all cores; each
+        worker builds its own converter, and outputs shared between files
+        (images, render cache entries) are exchanged through the filesystem.
+
+        Args:
+            files: Files to render, in output order
+
+        Returns:
+            Tuple of (executor, results in input order)
+        """
+        if self.config.pdf_settings.parallel_processes:
+            executor: Executor = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                initializer=_init_file_worker,
+                initargs=(self.config, self.repo_path, self._file_sizes),
+            )
+            return executor, executor.map(_process_file_in_worker, files, chunksize=8)
+
+        executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FILES)
+        return executor, executor.map(self._process_file_safe, files)
+
     def _collect_files(self) -> list[Path]:
         """
         Collect all files to process from repository.
@@ -205,53 +422,259 @@ class RepoPDFConverter:
         Returns:
             List of file paths to process
         """
-        all_files = []
+        return list(self._iter_files(self.repo_path))
+
+    def _iter_files(self, directory: Path) -> Iterator[Path]:
+        """
+        Walk a directory lazily, yielding files in sorted path order.
+
+        Uses an explicit stack of pending directory entries instead of
+        recursion. Each directory's entries are pushed in reverse name
+        order, which yields the same order as sorting the full path list.
+        Hidden directories are pruned as a whole instead of checking every
+        path component of every file. The size of each yielded file is
+        recorded from its cached DirEntry stat for _file_size().
+
+        Args:
+            directory: Directory to walk
 
-        for file_path in sorted(self.repo_path.rglob("*")):
-            # Skip directories
-            if not file_path.is_file():
+        Yields:
+            Paths of files to process
+        """
+        stack: List[os.DirEntry] = []
+
+        def push_entries(path: str) -> None:
+            try:
+                with os.scandir(path) as it:
+                    stack.extend(sorted(it, key=lambda entry: entry.name, reverse=True))
+            except OSError as e:
+                logger.warning(f"Failed to list directory {path}: {e}")
+
+        push_entries(str(directory))
+
+        while stack:
+            entry = stack.pop()
+            name = entry.name
+
+            # Don't follow directory symlinks
+            if entry.is_dir(follow_symlinks=False):
+                # Skip hidden directories
+                if not name.startswith("."):
+                    push_entries(entry.path)
                 continue
 
-            # Allow special dotfiles like .cursorrules
-            if file_path.name in [".cursorrules", ".gitignore", ".env.example"]:
-                all_files.append(file_path)
+            # Skip non-files
+            if not entry.is_file():
                 continue
 
-            # Skip hidden files/directories
-            if any(part.startswith(".") for part in file_path.parts):
+            # Skip hidden files, but allow special dotfiles like .cursorrules
+            if name.startswith(".") and name not in ALLOWED_HIDDEN_FILES:
                 continue
 
-            all_files.append(file_path)
+            # Skip file types that would produce no output
+            if (
+                os.path.splitext(name)[1].lower() not in _PROCESSED_EXTENSIONS
+                and name != ".cursorrules"
+            ):
+                continue
 
-        return all_files
+            path = Path(entry.path)
+            try:
+                self._file_sizes[path] = entry.stat().st_size
+            except OSError:
+                pass
+            yield path
 
-    def _process_single_file(self, file_path: Path) -> str:
+    def _file_size(self, file_path: Path) -> int:
+        """
+        Get a file's size, preferring the one recorded by _iter_files().
+
+        Args:
+            file_path: Path to file
+
+        Returns:
+            File size in bytes
+        """
+        size = self._file_sizes.get(file_path)
+        if size is None:
+            size = file_path.stat().st_size
+        return size
+
+    def _process_file_safe(
+        self, file_path: Path
+    ) -> Tuple[List[Fragment], Optional[bytes]]:
+        """
+        Process a single file, logging and skipping it on failure.
+
+        Args:
+            file_path: Path to file
+
+        Returns:
+            Tuple of (Markdown fragments, content digest). Fragments are
+            empty if the file was skipped or failed; the digest is None when
+            the file is not eligible for deduplication.
+        """
+        try:
+            return self._process_single_file(file_path)
+        except Exception as e:
+            logger.warning(f"Failed to process {file_path}: {e}")
+            # Continue with other files
+            return [], None
+
+    def _duplicate_file_stub(self, file_path: Path, first_path: Path) -> str:
+        """
+        Build the Markdown stub that replaces a duplicate file.
+
+        Args:
+            file_path: Duplicate file
+            first_path: Earlier file with identical content
+
+        Returns:
+            Markdown section pointing at the first copy
+        """
+        rel_path = file_path.relative_to(self.repo_path)
+        first_rel = first_path.relative_to(self.repo_path)
+        return f"\n\n# {rel_path}\n\n> 此文件内容与 `{first_rel}` 相同，已省略\n\n"
+
+    def _process_single_file(
+        self, file_path: Path
+    ) -> Tuple[List[Fragment], Optional[bytes]]:
         """
         Process a single file and return its Markdown representation.
 
+        The Markdown is returned as a list of fragments so the caller can
+        write them out directly instead of concatenating per-file strings.
+        Output served from the render cache is returned as the cache entry
+        path so its bytes can be spliced into the output file.
+
         Args:
             file_path: Path to file
 
         Returns:
-            Markdown content for the file
+            Tuple of (Markdown fragments, content digest). Fragments are
+            empty if the file is skipped; the digest is None when the file
+            is not eligible for deduplication.
         """
         ext = file_path.suffix.lower()
         rel_path = file_path.relative_to(self.repo_path)
 
         # Check if should ignore
         if self.file_processor.should_ignore(file_path):
-            return ""
+            return [], None
 
         # Check file size
         try:
-            file_size_mb = file_path.stat().st_size / (1024 * 1024)
+            file_size = self._file_size(file_path)
+            file_size_mb = file_size / (1024 * 1024)
             if file_size_mb > 0.5 and ext not in IMAGE_EXTENSIONS:
                 logger.debug(f"Skipping large file ({file_size_mb:.1f}MB): {file_path}")
-                return ""
+                return [], None
         except Exception as e:
             logger.warning(f"Failed to get size for {file_path}: {e}")
-            return ""
+            return [], None
+
+        # The render cache key and the deduplication digest share one read
+        # of the raw bytes
+        data = None
+        if ext not in IMAGE_EXTENSIONS and (
+            (self.config.pdf_settings.render_cache and ext != ".html")
+            or (self.config.pdf_settings.deduplicate_files and file_size >= DEDUP_MIN_BYTES)
+        ):
+            try:
+                data = file_path.read_bytes()
+            except OSError as e:
+                logger.debug(f"Render cache and deduplication disabled for {file_path}: {e}")
+
+        digest = self._content_digest(ext, data)
+
+        # Reuse Markdown rendered by an earlier run when nothing changed
+        cache_key = self._render_cache_key(ext, rel_path, data)
+        if cache_key:
+            cached_path = self.render_cache.get_path(cache_key)
+            if cached_path is not None:
+                return [cached_path], digest
+
+        fragments = self._render_file(file_path, ext, rel_path)
+
+        if cache_key and fragments and not any(
+            marker in fragment
+            for fragment in fragments
+            for marker in _UNCACHEABLE_OUTPUT_MARKERS
+        ):
+            self.render_cache.put(cache_key, fragments)
+
+        return fragments, digest if fragments else None
+
+    def _content_digest(self, ext: str, data: Optional[bytes]) -> Optional[bytes]:
+        """
+        Get the deduplication digest of a file's content.
+
+        The extension is hashed with the bytes: it selects the renderer and
+        the code language, so identical bytes with another extension render
+        differently and are not duplicates.
+
+        Args:
+            ext: Lowercased file extension
+            data: Raw file content, or None if it was not read
 
+        Returns:
+            Digest, or None if the file is not eligible for deduplication
+        """
+        if (
+            data is None
+            or not self.config.pdf_settings.deduplicate_files
+            or len(data) < DEDUP_MIN_BYTES
+        ):
+            return None
+
+        digest = hashlib.blake2b(ext.encode("utf-8"), digest_size=16)
+        digest.update(b"\0")
+        digest.update(data)
+        return digest.digest()
+
+    def _render_cache_key(
+        self, ext: str, rel_path: Path, data: Optional[bytes]
+    ) -> Optional[str]:
+        """
+        Get the render cache key for a file, if its output may be cached.
+
+        Images and HTML are excluded: the former only have side effects and
+        the latter depend on the installed pandoc. Markdown that references
+        images is excluded because its output depends on other files.
+
+        Args:
+            ext: Lowercased file extension
+            rel_path: Path relative to repository root
+            data: Raw file content, or None if it could not be read
+
+        Returns:
+            Cache key, or None if the file should not be cached
+        """
+        if not self.config.pdf_settings.render_cache or data is None:
+            return None
+
+        if ext in IMAGE_EXTENSIONS or ext == ".html":
+            return None
+
+        if ext in {".md", ".mdx"}:
+            lowered = data.lower()
+            if b"![" in data or b"<img" in lowered or b"<svg" in lowered:
+                return None
+
+        return self.render_cache.make_key(rel_path.as_posix(), data)
+
+    def _render_file(self, file_path: Path, ext: str, rel_path: Path) -> List[str]:
+        """
+        Render a file to Markdown fragments based on its type.
+
+        Args:
+            file_path: Path to file
+            ext: Lowercased file extension
+            rel_path: Path relative to repository root
+
+        Returns:
+            Markdown fragments for the file (empty if the file is skipped)
+        """
         # Process images
         if ext in IMAGE_EXTENSIONS:
             return self._process_image_file(file_path)
@@ -272,12 +695,10 @@ class RepoPDFConverter:
         if file_path.name == ".cursorrules":
             return self._process_cursorrules_file(file_path, rel_path)
 
-        return ""
-
-    def _process_image_file(self, file_path: Path) -> str:
-        """Process image file (copy to images directory)."""
-        import shutil
+        return []
 
+    def _process_image_file(self, file_path: Path) -> List[str]:
+        """Process image file (link or copy to images directory)."""
         ext = file_path.suffix.lower()
 
         try:
@@ -285,84 +706,84 @@ class RepoPDFConverter:
                 # Convert SVG to PNG
                 self.image_converter.convert_image_to_png(file_path, self.repo_path)
             else:
-                # Copy other images
-                target_path = self.images_dir / file_path.name
-                shutil.copy2(file_path, target_path)
+                # Link or copy other images
+                target_path = self.images_dir / self.image_converter.local_image_name(
+                    file_path, self.repo_path
+                )
+                _link_or_copy(file_path, target_path)
         except Exception as e:
             logger.warning(f"Failed to process image {file_path}: {e}")
 
-        return ""  # Images are referenced, not included directly
+        return []  # Images are referenced, not included directly
 
-    def _process_markdown_file(self, file_path: Path, rel_path: Path) -> str:
+    def _process_markdown_file(self, file_path: Path, rel_path: Path) -> List[str]:
         """Process Markdown file."""
         try:
             content = self.file_processor.read_file_safe(file_path)
 
-            # Process markdown content
+            # Process markdown content (this also escapes YAML delimiters)
             processed = self.markdown_processor.process_markdown_content(
                 content, file_path, self.repo_path
             )
 
-            # Escape YAML delimiters
-            import re
-
-            processed = re.sub(r"^---$", r"\\---", processed, flags=re.MULTILINE)
-
             # Return with header
             if file_path.suffix == ".mdx":
-                return f"\n\n# {rel_path}\n\n`````mdx\n{processed}\n`````\n\n"
-            else:
-                return f"\n\n# {rel_path}\n\n{processed}\n\n"
+                return [f"\n\n# {rel_path}\n\n`````mdx\n", processed, "\n`````\n\n"]
+            return [f"\n\n# {rel_path}\n\n", processed, "\n\n"]
 
         except Exception as e:
             logger.warning(f"Failed to process Markdown file {file_path}: {e}")
-            return ""
+            return []
 
-    def _process_html_file(self, file_path: Path, rel_path: Path) -> str:
+    def _process_html_file(self, file_path: Path, rel_path: Path) -> List[str]:
         """Process HTML file (convert to Markdown using Pandoc)."""
         try:
             content = self.file_processor.read_file_safe(file_path)
 
+            # Pandoc always speaks UTF-8; stderr is never used, so discard it
             result = subprocess.run(
                 ["pandoc", "--from=html", "--to=markdown", "--wrap=none"],
-                input=content,
-                text=True,
-                capture_output=True,
+                input=content.encode("utf-8"),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 timeout=30,
             )
 
             if result.returncode == 0:
-                return f"\n\n# {rel_path}\n\n{result.stdout}\n\n"
+                markdown = result.stdout.decode("utf-8", "replace")
+                return [f"\n\n# {rel_path}\n\n", markdown, "\n\n"]
 
         except Exception as e:
             logger.warning(f"Failed to process HTML file {file_path}: {e}")
 
-        return ""
+        return []
 
-    def _process_code_file(self, file_path: Path, ext: str, rel_path: Path) -> str:
+    def _process_code_file(self, file_path: Path, ext: str, rel_path: Path) -> List[str]:
         """Process code file with syntax highlighting."""
         try:
             content = self.file_processor.read_file_safe(file_path)
 
             # Skip files containing SVG (likely icon files)
             if self.code_processor.should_skip_file(content):
-                return ""
+                return []
 
             # Process with code processor
-            return self.code_processor.process_code_file(content, ext, str(rel_path))
+            return self.code_processor.process_code_file_fragments(
+                content, ext, str(rel_path)
+            )
 
         except Exception as e:
             logger.warning(f"Failed to process code file {file_path}: {e}")
-            return ""
+            return []
 
-    def _process_cursorrules_file(self, file_path: Path, rel_path: Path) -> str:
+    def _process_cursorrules_file(self, file_path: Path, rel_path: Path) -> List[str]:
         """Process .cursorrules file."""
         try:
             content = self.file_processor.read_file_safe(file_path)
-            return f"\n\n# {rel_path}\n\n`````markdown\n{content}\n`````\n\n"
+            return [f"\n\n# {rel_path}\n\n`````markdown\n", content, "\n`````\n\n"]
         except Exception as e:
             logger.warning(f"Failed to process .cursorrules file {file_path}: {e}")
-            return ""
+            return []
 
     def _generate_pdf(self, markdown_file: Path, pandoc_config: Path) -> Path:
         """
@@ -383,6 +804,8 @@ class RepoPDFConverter:
         output_pdf = self.output_dir / f"{self.repo_path.name}_{timestamp}.pdf"
 
         # Build pandoc command
+        # Pandoc must find images referenced relative to the repo root and
+        # those generated/copied under temp_dir (current working directory)
         cmd = [
             "pandoc",
             str(markdown_file),
@@ -390,30 +813,58 @@ class RepoPDFConverter:
             str(output_pdf),
             "--defaults",
             str(pandoc_config),
-            "--toc",
-            "--toc-depth=2",
+            *_PANDOC_STATIC_ARGS,
             "-V",
             f"title={self.repo_path.name} 代码文档",
-            "-V",
-            "date=\\today",
+            "--resource-path",
+            os.pathsep.join((str(self.temp_dir), str(self.repo_path))),
         ]
 
-        # Ensure Pandoc can find images referenced relative to the repo root
-        # and those generated/copied under temp_dir (current working directory).
-        resource_paths = [str(self.temp_dir), str(self.repo_path)]
-        cmd.extend(["--resource-path", os.pathsep.join(resource_paths)])
-
         logger.info(f"Running Pandoc: {' '.join(cmd)}")
 
         try:
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=600, cwd=self.temp_dir
+            # Stream pandoc output through drain threads so large amounts of
+            # LaTeX warnings are never buffered in memory; keep only the tail
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=self.temp_dir,
+                env={**os.environ, **XELATEX_MEMORY_ENV},
             )
-
-            if result.returncode != 0:
-                logger.error(f"Pandoc stderr: {result.stderr}")
+            stdout_tail: Deque[bytes] = deque(maxlen=PANDOC_OUTPUT_TAIL_LINES)
+            stderr_tail: Deque[bytes] = deque(maxlen=PANDOC_OUTPUT_TAIL_LINES)
+            drains = [
+                threading.Thread(
+                    target=_drain_stream,
+                    args=(process.stdout, stdout_tail, "stdout"),
+                    daemon=True,
+                ),
+                threading.Thread(
+                    target=_drain_stream,
+                    args=(process.stderr, stderr_tail, "stderr"),
+                    daemon=True,
+                ),
+            ]
+            for drain in drains:
+                drain.start()
+
+            try:
+                returncode = process.wait(timeout=600)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                raise
+            finally:
+                for drain in drains:
+                    drain.join()
+
+            if returncode != 0:
+                # Decode only on failure; successful runs never pay for it
+                stderr = b"".join(stderr_tail).decode("utf-8", "replace")
+                logger.error(f"Pandoc stderr: {stderr}")
                 raise ConversionError(
-                    "Pandoc conversion failed", details=result.stderr
+                    "Pandoc conversion failed", details=stderr
                 )
 
             if not output_pdf.exists():
@@ -0,0 +1,22 @@
+"""Lazy loading of the optional cairosvg SVG rasterizer."""
+
+import functools
+from types import ModuleType
+from typing import Optional
+
+
+# cairosvg is optional at runtime and loads the native Cairo library, so it
+# is imported on first use; the import fails with OSError when Cairo is missing
+@functools.lru_cache(maxsize=None)
+def load_cairosvg() -> Optional[ModuleType]:
+    """
+    Import cairosvg once.
+
+    Returns:
+        The cairosvg module, or None if it or the Cairo library is unavailable
+    """
+    try:
+        import cairosvg
+    except (ImportError, OSError):
+        return None
+    return cairosvg
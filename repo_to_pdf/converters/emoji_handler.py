@@ -7,6 +7,7 @@ from typing import Dict, List, Optional
 
 import requests
 
+from repo_to_pdf.converters.cairosvg_loader import load_cairosvg
 from repo_to_pdf.core.constants import EMOJI_DOWNLOAD_TIMEOUT
 from repo_to_pdf.core.exceptions import EmojiProcessingError
 
@@ -197,9 +198,12 @@ class EmojiHandler:
         Returns:
             PNG filename if successful, None otherwise
         """
-        try:
-            import cairosvg
+        cairosvg = load_cairosvg()
+        if cairosvg is None:
+            logger.error("cairosvg not installed, cannot convert emoji SVG to PNG")
+            return None
 
+        try:
             png_filename = f"{name}.png"
             png_path = self.cache_dir / png_filename
 
@@ -208,9 +212,6 @@ class EmojiHandler:
             logger.debug(f"Converted emoji to PNG: {png_filename}")
             return png_filename
 
-        except ImportError:
-            logger.error("cairosvg not installed, cannot convert emoji SVG to PNG")
-            return None
         except Exception as e:
             logger.warning(f"Failed to convert emoji SVG to PNG: {e}")
             return None
@@ -1,42 +1,97 @@
 """Image conversion utilities for SVG to PNG and remote image handling."""
 
 import hashlib
+import json
 import logging
+import os
+import re
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Iterable, Optional, Tuple
+from urllib.parse import urlparse
 from xml.etree import ElementTree as ET
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 
+from repo_to_pdf.converters.cairosvg_loader import load_cairosvg
 from repo_to_pdf.core.constants import (
     IMAGE_DOWNLOAD_TIMEOUT,
+    MAX_CONCURRENT_DOWNLOADS,
+    MAX_WORKER_THREADS,
     DEFAULT_IMAGE_WIDTH,
     DEFAULT_IMAGE_HEIGHT,
     CAIROSVG_SCALE,
     CAIROSVG_WIDTH,
     CAIROSVG_HEIGHT,
+    SVG_MAX_RASTER_WIDTH,
 )
 from repo_to_pdf.core.exceptions import ImageProcessingError
 
 logger = logging.getLogger(__name__)
 
+# Opening <svg> tag, and a non-empty size attribute within it
+_SVG_OPEN_TAG_RE = re.compile(r"<svg\b[^>]*>", re.IGNORECASE)
+_SVG_SIZE_ATTR_RE = re.compile(
+    r"(?<![\w-])(?:width|height|viewBox)\s*=\s*(?:\"[^\"]+\"|'[^']+'|[^\s\"'>]+)",
+    re.IGNORECASE,
+)
+
+# Width attribute of an <svg> tag, as a number and an optional absolute unit
+_SVG_WIDTH_ATTR_RE = re.compile(
+    r"(?<![\w-])width\s*=\s*[\"']?\s*([0-9]*\.?[0-9]+)\s*(px|pt|pc|in|cm|mm)?\s*[\"'\s>/]",
+    re.IGNORECASE,
+)
+
+# CSS pixels per unit, used to find an SVG's natural size
+_SVG_UNIT_PX = {
+    "": 1.0,
+    "px": 1.0,
+    "pt": 96 / 72,
+    "pc": 16.0,
+    "in": 96.0,
+    "cm": 96 / 2.54,
+    "mm": 96 / 25.4,
+}
+
+# Sidecar in the cache directory holding HTTP validators for downloaded images
+_REMOTE_META_FILENAME = "remote_images.json"
+
 
 class ImageConverter:
     """Handles image format conversion and remote image downloading."""
 
-    def __init__(self, cache_dir: Path):
+    def __init__(self, cache_dir: Path, max_raster_width: int = SVG_MAX_RASTER_WIDTH):
         """
         Initialize the image converter.
 
         Args:
             cache_dir: Directory to store converted and downloaded images
+            max_raster_width: Maximum pixel width of PNGs rendered from SVG
         """
         self.cache_dir = cache_dir
+        self.max_raster_width = max_raster_width
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._conversion_cache: dict[str, str] = {}
+        self._failed_urls: set[str] = set()
+        self._local_image_names: dict[Tuple[Path, Path], str] = {}
+
+        # ETag/Last-Modified of images downloaded by earlier runs, so they
+        # can be revalidated with conditional requests instead of refetched
+        self._remote_meta_path = self.cache_dir / _REMOTE_META_FILENAME
+        self._remote_meta: dict[str, dict[str, Any]] = self._load_remote_meta()
+        self._remote_meta_lock = threading.Lock()
+
+        # Shared session so repeated downloads reuse keep-alive connections
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=MAX_CONCURRENT_DOWNLOADS, pool_maxsize=MAX_WORKER_THREADS
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
     def convert_svg_to_png(
         self, svg_content: str, output_path: Path, use_inkscape_fallback: bool = True
@@ -55,9 +110,16 @@ class ImageConverter:
         Raises:
             ImageProcessingError: If conversion fails critically
         """
-        try:
-            import cairosvg
+        cairosvg = load_cairosvg()
+        if cairosvg is None:
+            logger.warning("Failed to convert SVG using cairosvg: cairosvg is not available")
+
+            if use_inkscape_fallback:
+                return self._convert_with_inkscape(svg_content, output_path)
+
+            return False
 
+        try:
             # Remove XML declaration
             svg_content = self._clean_svg_content(svg_content)
 
@@ -69,13 +131,15 @@ class ImageConverter:
             # Parse and fix SVG dimensions
             svg_content = self._fix_svg_dimensions(svg_content)
 
-            # Convert to PNG with cairosvg
+            # Convert to PNG with cairosvg; output_width replaces the scale
+            # factor when the scaled image would exceed the raster limit
             cairosvg.svg2png(
                 bytestring=svg_content.encode("utf-8"),
                 write_to=str(output_path),
                 parent_width=CAIROSVG_WIDTH,
                 parent_height=CAIROSVG_HEIGHT,
                 scale=CAIROSVG_SCALE,
+                output_width=self._capped_output_width(svg_content),
             )
 
             logger.debug(f"Successfully converted SVG to PNG: {output_path}")
@@ -89,6 +153,78 @@ class ImageConverter:
 
             return False
 
+    def _svg_png_path(self, svg_content: str) -> Path:
+        """
+        Get the cache path of the PNG rendered from SVG content.
+
+        The cache directory outlives a run, so the name covers the raster
+        width limit as well as the content: PNGs rendered for another
+        device preset are not reused.
+
+        Args:
+            svg_content: Raw SVG content
+
+        Returns:
+            Path of the PNG in the cache directory
+        """
+        digest = hashlib.blake2b(svg_content.encode(), digest_size=16)
+        digest.update(f"\0{self.max_raster_width}".encode())
+        return self.cache_dir / f"{digest.hexdigest()}.png"
+
+    def local_image_name(self, image_path: Path, repo_root: Path) -> str:
+        """
+        Get the name a repository image is given in the cache directory.
+
+        Images from the whole repository share the flat cache directory, so
+        the name carries a hash of the image's path within the repository:
+        two different logo.png files get different names regardless of
+        which one is linked in first. Symlinks are resolved, so every path
+        to the same file gets the same name.
+
+        Args:
+            image_path: Path to the image file
+            repo_root: Root directory of the repository
+
+        Returns:
+            File name within the cache directory
+        """
+        key = (image_path, repo_root)
+        name = self._local_image_names.get(key)
+        if name is None:
+            real_path = os.path.realpath(image_path)
+            try:
+                relative = os.path.relpath(real_path, os.path.realpath(repo_root))
+            except ValueError:
+                # On another drive than the repository (Windows)
+                relative = real_path
+            digest = hashlib.blake2b(
+                relative.replace(os.sep, "/").encode(), digest_size=6
+            ).hexdigest()
+            stem, suffix = os.path.splitext(os.path.basename(real_path))
+            name = f"{stem}-{digest}{suffix}"
+            self._local_image_names[key] = name
+        return name
+
+    def _capped_output_width(self, svg_content: str) -> Optional[int]:
+        """
+        Get the output width that keeps a rasterized SVG within the limit.
+
+        Args:
+            svg_content: SVG content with dimensions already fixed
+
+        Returns:
+            Pixel width to render at, or None to render at the normal scale
+        """
+        tag = _SVG_OPEN_TAG_RE.search(svg_content)
+        match = _SVG_WIDTH_ATTR_RE.search(tag.group(0)) if tag else None
+        if not match:
+            return None
+
+        width = float(match.group(1)) * _SVG_UNIT_PX[(match.group(2) or "").lower()]
+        if width * CAIROSVG_SCALE <= self.max_raster_width:
+            return None
+        return self.max_raster_width
+
     def _clean_svg_content(self, svg_content: str) -> str:
         """Remove XML declarations and clean SVG content."""
         svg_content = svg_content.replace(
@@ -124,6 +260,9 @@ class ImageConverter:
                 details=str(e)
             )
 
+        # Remember the original attributes to detect whether anything changed
+        original_size = (tree.get("width"), tree.get("height"))
+
         # Get current dimensions
         width = tree.get("width", "").strip()
         height = tree.get("height", "").strip()
@@ -149,6 +288,10 @@ class ImageConverter:
         # Ensure units are present
         self._ensure_units(tree)
 
+        # Already well-sized SVGs are passed through without re-serializing
+        if (tree.get("width"), tree.get("height")) == original_size:
+            return svg_content
+
         # Convert back to string
         return ET.tostring(tree, encoding="unicode")
 
@@ -213,7 +356,7 @@ class ImageConverter:
                 "inkscape",
                 "--export-type=png",
                 f"--export-filename={output_path}",
-                "--export-width=1600",
+                f"--export-width={min(CAIROSVG_WIDTH, self.max_raster_width)}",
                 str(temp_svg),
             ]
 
@@ -245,14 +388,8 @@ class ImageConverter:
         Returns:
             True if valid SVG, False otherwise
         """
-        try:
-            soup = BeautifulSoup(content, "html.parser")
-            svg = soup.find("svg")
-            return svg is not None and (
-                svg.get("width") or svg.get("height") or svg.get("viewBox")
-            )
-        except Exception:
-            return False
+        svg_tag = _SVG_OPEN_TAG_RE.search(content)
+        return svg_tag is not None and _SVG_SIZE_ATTR_RE.search(svg_tag.group(0)) is not None
 
     def convert_image_to_png(self, image_path: Path, project_root: Path) -> str:
         """
@@ -270,6 +407,11 @@ class ImageConverter:
             if not image_path.is_absolute():
                 image_path = project_root / image_path
 
+            # Check cache first; a repeated reference needs no stat
+            cache_key = str(image_path)
+            if cache_key in self._conversion_cache:
+                return self._conversion_cache[cache_key]
+
             if not image_path.exists():
                 logger.warning(f"Image file not found: {image_path}")
                 return str(image_path)
@@ -278,17 +420,11 @@ class ImageConverter:
             if not image_path.suffix.lower() == ".svg":
                 return str(image_path)
 
-            # Check cache first
-            cache_key = str(image_path)
-            if cache_key in self._conversion_cache:
-                return self._conversion_cache[cache_key]
-
             # Read SVG content
             svg_content = image_path.read_text(encoding="utf-8")
 
             # Generate output path
-            hash_name = hashlib.md5(svg_content.encode()).hexdigest()
-            png_path = self.cache_dir / f"{hash_name}.png"
+            png_path = self._svg_png_path(svg_content)
 
             # Check if already converted
             if png_path.exists():
@@ -320,8 +456,7 @@ class ImageConverter:
         """
         try:
             # Generate hash-based filename
-            hash_name = hashlib.md5(svg_content.encode()).hexdigest()
-            png_path = self.cache_dir / f"{hash_name}.png"
+            png_path = self._svg_png_path(svg_content)
 
             # Check cache
             if png_path.exists():
@@ -351,13 +486,34 @@ class ImageConverter:
             # Check cache first
             if url in self._conversion_cache:
                 return self._conversion_cache[url]
-
-            # Generate hash-based filename
-            hash_name = hashlib.md5(url.encode()).hexdigest()
+            if url in self._failed_urls:
+                return None
+
+            # Revalidate a copy downloaded by an earlier run, if any: a PNG
+            # rasterized at this run's width limit, or an image saved as is.
+            # Entries without a recorded width predate the width-aware names
+            meta = self._remote_meta.get(
+                self._remote_meta_key(url, self.max_raster_width)
+            ) or self._remote_meta.get(url)
+            headers = {}
+            if meta and "max_width" in meta and (self.cache_dir / meta["file"]).exists():
+                if meta.get("etag"):
+                    headers["If-None-Match"] = meta["etag"]
+                if meta.get("last_modified"):
+                    headers["If-Modified-Since"] = meta["last_modified"]
 
             # Download image
             logger.debug(f"Downloading image: {url}")
-            response = requests.get(url, timeout=IMAGE_DOWNLOAD_TIMEOUT)
+            response = self._session.get(
+                url, headers=headers, timeout=IMAGE_DOWNLOAD_TIMEOUT
+            )
+
+            if response.status_code == 304 and headers:
+                logger.debug(f"Remote image not modified: {url}")
+                relative_path = f"images/{meta['file']}"
+                self._conversion_cache[url] = relative_path
+                return relative_path
+
             response.raise_for_status()
 
             # Determine content type
@@ -365,42 +521,147 @@ class ImageConverter:
 
             if "svg" in content_type or url.lower().endswith(".svg"):
                 # Convert SVG to PNG
-                png_path = self.cache_dir / f"{hash_name}.png"
-
-                if png_path.exists():
-                    relative_path = f"images/{png_path.name}"
-                    self._conversion_cache[url] = relative_path
-                    return relative_path
-
-                if self.convert_svg_to_png(response.text, png_path):
-                    relative_path = f"images/{png_path.name}"
-                    self._conversion_cache[url] = relative_path
-                    return relative_path
-
+                local_path = self._remote_svg_png_path(url)
+                converted = self.convert_svg_to_png(response.text, local_path)
+                max_width: Optional[int] = self.max_raster_width
             else:
-                # Save other image formats directly
+                # Save other image formats directly, under a hash-based name
                 ext = self._get_extension_from_content_type(content_type, url)
+                hash_name = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
                 local_path = self.cache_dir / f"{hash_name}{ext}"
-
-                if local_path.exists():
-                    relative_path = f"images/{local_path.name}"
-                    self._conversion_cache[url] = relative_path
-                    return relative_path
-
                 local_path.write_bytes(response.content)
+                converted = True
+                max_width = None
+
+            if converted:
+                self._record_remote_meta(url, local_path.name, response, max_width)
                 relative_path = f"images/{local_path.name}"
                 self._conversion_cache[url] = relative_path
                 return relative_path
 
+            self._failed_urls.add(url)
             return None
 
         except requests.RequestException as e:
             logger.warning(f"Failed to download remote image {url}: {e}")
+            self._failed_urls.add(url)
             return None
         except Exception as e:
             logger.warning(f"Unexpected error downloading {url}: {e}")
+            self._failed_urls.add(url)
             return None
 
+    def _remote_svg_png_path(self, url: str) -> Path:
+        """
+        Get the cache path of the PNG rasterized from a remote SVG.
+
+        Like _svg_png_path(), the name covers the raster width limit, so a
+        PNG rendered for another device preset is never reused.
+
+        Args:
+            url: URL of the remote SVG
+
+        Returns:
+            Path of the PNG in the cache directory
+        """
+        digest = hashlib.blake2b(url.encode(), digest_size=16)
+        digest.update(f"\0{self.max_raster_width}".encode())
+        return self.cache_dir / f"{digest.hexdigest()}.png"
+
+    @staticmethod
+    def _remote_meta_key(url: str, max_width: Optional[int]) -> str:
+        """
+        Get the metadata key of a downloaded image.
+
+        Rasterized SVGs are recorded per width limit, so each device preset
+        keeps its own validators and PNG; other images are recorded per URL.
+
+        Args:
+            url: URL of the remote image
+            max_width: Raster width limit of a rasterized SVG, None otherwise
+
+        Returns:
+            Key into the remote image metadata
+        """
+        return url if max_width is None else f"{url}\0{max_width}"
+
+    def _load_remote_meta(self) -> dict[str, dict[str, Any]]:
+        """Load HTTP validators saved by earlier runs."""
+        try:
+            with open(self._remote_meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            return meta if isinstance(meta, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _record_remote_meta(
+        self,
+        url: str,
+        file_name: str,
+        response: requests.Response,
+        max_width: Optional[int] = None,
+    ) -> None:
+        """
+        Save the validators of a downloaded image for later revalidation.
+
+        Args:
+            url: URL of the remote image
+            file_name: Name of the local file in the cache directory
+            response: Response the image was saved from
+            max_width: Raster width limit the file was rendered at, None if
+                the image was saved as is
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not (etag or last_modified):
+            return
+
+        entry: dict[str, Any] = {"file": file_name, "max_width": max_width}
+        if etag:
+            entry["etag"] = etag
+        if last_modified:
+            entry["last_modified"] = last_modified
+
+        with self._remote_meta_lock:
+            # Merge with the file first: other converters (e.g. process pool
+            # workers) record their downloads in the same sidecar
+            self._remote_meta.update(self._load_remote_meta())
+            self._remote_meta[self._remote_meta_key(url, max_width)] = entry
+            temp_path = self._remote_meta_path.with_name(
+                f"{self._remote_meta_path.name}.{os.getpid()}.tmp"
+            )
+            try:
+                temp_path.write_text(json.dumps(self._remote_meta), encoding="utf-8")
+                os.replace(temp_path, self._remote_meta_path)
+            except OSError as e:
+                logger.debug(f"Failed to save remote image metadata: {e}")
+
+    def prefetch_remote_images(self, urls: Iterable[str]) -> None:
+        """
+        Download several remote images concurrently.
+
+        Results land in the same caches download_remote_image() consults, so
+        later per-image calls return immediately. Failed URLs are remembered
+        for the rest of the run and not retried.
+
+        Args:
+            urls: Remote image URLs (duplicates are ignored)
+        """
+        pending = [
+            url
+            for url in dict.fromkeys(urls)
+            if url not in self._conversion_cache and url not in self._failed_urls
+        ]
+        # A single download gains nothing from a pool
+        if len(pending) < 2:
+            return
+
+        logger.debug(f"Prefetching {len(pending)} remote images")
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_CONCURRENT_DOWNLOADS, len(pending))
+        ) as executor:
+            list(executor.map(self.download_remote_image, pending))
+
     def _get_extension_from_content_type(self, content_type: str, url: str) -> str:
         """Determine file extension from content type or URL."""
         if "image/png" in content_type:
@@ -413,7 +674,6 @@ class ImageConverter:
             return ".webp"
         else:
             # Try to get extension from URL
-            from urllib.parse import urlparse
             path = urlparse(url).path
             ext = Path(path).suffix
             return ext if ext else ".png"
@@ -421,6 +681,7 @@ class ImageConverter:
     def clear_cache(self) -> None:
         """Clear the conversion cache."""
         self._conversion_cache.clear()
+        self._failed_urls.clear()
 
     def get_cache_stats(self) -> dict[str, int]:
         """Get statistics about the conversion cache."""
@@ -1,155 +1,21 @@
 """LaTeX header and pandoc configuration generation."""
 
+import json
 import logging
 import platform
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
 from repo_to_pdf.core.config import AppConfig
+from repo_to_pdf.core.constants import PANDOC_INPUT_FORMAT, PANDOC_PDF_ENGINE_OPTS
 
 logger = logging.getLogger(__name__)
 
 
-def get_system_fonts() -> Dict[str, str]:
-    """
-    Detect system fonts based on platform.
-
-    Returns:
-        Dictionary with font names for main_font, sans_font, mono_font, and emoji_fonts
-    """
-    system = platform.system()
-
-    if system == "Darwin":  # macOS
-        return {
-            "main_font": "Songti SC",
-            "sans_font": "Heiti SC",
-            "mono_font": "SF Mono",
-            "emoji_fonts": ["Apple Color Emoji"],
-        }
-    else:  # Linux/WSL
-        # Prefer widely available fonts; avoid Symbola to prevent TeX fallback issues
-        return {
-            "main_font": "Noto Serif CJK SC",
-            "sans_font": "Noto Sans CJK SC",
-            "mono_font": "DejaVu Sans Mono",
-            "emoji_fonts": ["Noto Color Emoji"],
-        }
-
-
-class LaTeXGenerator:
-    """Generates LaTeX headers and pandoc configuration."""
-
-    def __init__(self, config: AppConfig, output_dir: Path):
-        """
-        Initialize the LaTeX generator.
-
-        Args:
-            config: Application configuration
-            output_dir: Directory where LaTeX files will be written
-        """
-        self.config = config
-        self.output_dir = output_dir
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-
-    def generate_pandoc_config(self, repo_name: str) -> Path:
-        """
-        Generate pandoc defaults YAML configuration.
-
-        Args:
-            repo_name: Repository name for PDF title
-
-        Returns:
-            Path to generated pandoc defaults file
-        """
-        # Get system fonts
-        system_fonts = get_system_fonts()
-
-        # Get fonts from config, fallback to system fonts
-        main_font = self.config.pdf_settings.main_font or system_fonts["main_font"]
-        sans_font = self.config.pdf_settings.sans_font or system_fonts["sans_font"]
-        mono_font = self.config.pdf_settings.mono_font or system_fonts["mono_font"]
-
-        # Get PDF settings
-        code_fontsize = self.config.pdf_settings.code_fontsize
-        fontsize = self.config.pdf_settings.fontsize
-        linespread = self.config.pdf_settings.linespread
-        parskip = self.config.pdf_settings.parskip
-        margin = self.config.pdf_settings.margin
-        highlight_style = self.config.pdf_settings.highlight_style
-
-        # Generate header.tex file first
-        header_tex_path = self.generate_latex_header(
-            repo_name, main_font, sans_font, mono_font, system_fonts
-        )
-
-        # Create pandoc defaults YAML
-        yaml_content = f"""# Pandoc defaults file
-pdf-engine: xelatex
-from: markdown+fenced_code_attributes+fenced_code_blocks+backtick_code_blocks+raw_tex-yaml_metadata_block-tex_math_dollars
-highlight-style: {highlight_style}
-
-include-in-header:
-  - {header_tex_path}
-
-variables:
-  documentclass: article
-  geometry: {margin}
-  CJKmainfont: "{main_font}"
-  CJKsansfont: "{sans_font}"
-  CJKmonofont: "{main_font}"
-  monofont: "{mono_font}"
-  monofontoptions:
-    - Scale=0.85
-  colorlinks: true
-  linkcolor: blue
-  urlcolor: blue
-"""
-
-        yaml_path = self.output_dir / "pandoc_defaults.yaml"
-        yaml_path.write_text(yaml_content, encoding="utf-8")
-
-        logger.info(f"Generated pandoc config: {yaml_path}")
-        return yaml_path
-
-    def generate_latex_header(
-        self,
-        repo_name: str,
-        main_font: str,
-        sans_font: str,
-        mono_font: str,
-        system_fonts: Dict[str, str],
-    ) -> Path:
-        """
-        Generate LaTeX header file (header.tex).
-
-        Args:
-            repo_name: Repository name for PDF title
-            main_font: Main document font
-            sans_font: Sans-serif font
-            mono_font: Monospace font
-            system_fonts: System fonts dictionary
-
-        Returns:
-            Path to generated header.tex file
-        """
-        # Get emoji font candidates
-        emoji_candidates = self._get_emoji_font_candidates(system_fonts)
-
-        # Generate emoji font fallback setup
-        emoji_setup_tex = self._generate_emoji_fallback_setup(emoji_candidates, mono_font)
-
-        # Get PDF settings
-        code_fontsize = self.config.pdf_settings.code_fontsize
-        linespread = self.config.pdf_settings.linespread
-        parskip = self.config.pdf_settings.parskip
-
-        # Get code block visual settings
-        code_bg = self.config.pdf_settings.code_block_bg
-        code_border = self.config.pdf_settings.code_block_border
-        code_padding = self.config.pdf_settings.code_block_padding
-
-        # Build header content
-        header_content = f"""% LaTeX header for repo-to-pdf
+# Static LaTeX header template; placeholders are filled in by
+# LaTeXGenerator.generate_latex_header() with str.format()
+_LATEX_HEADER_TEMPLATE = """% LaTeX header for repo-to-pdf
 % Generated automatically - do not edit manually
 
 % ============================================================================
@@ -270,6 +136,162 @@ variables:
 \\emergencystretch=5em
 """
 
+
+def get_system_fonts() -> Dict[str, str]:
+    """
+    Detect system fonts based on platform.
+
+    Returns:
+        Dictionary with font names for main_font, sans_font, mono_font, and emoji_fonts
+    """
+    system = platform.system()
+
+    if system == "Darwin":  # macOS
+        return {
+            "main_font": "Songti SC",
+            "sans_font": "Heiti SC",
+            "mono_font": "SF Mono",
+            "emoji_fonts": ["Apple Color Emoji"],
+        }
+    else:  # Linux/WSL
+        # Prefer widely available fonts; avoid Symbola to prevent TeX fallback issues
+        return {
+            "main_font": "Noto Serif CJK SC",
+            "sans_font": "Noto Sans CJK SC",
+            "mono_font": "DejaVu Sans Mono",
+            "emoji_fonts": ["Noto Color Emoji"],
+        }
+
+
+class LaTeXGenerator:
+    """Generates LaTeX headers and pandoc configuration."""
+
+    def __init__(self, config: AppConfig, output_dir: Path):
+        """
+        Initialize the LaTeX generator.
+
+        Args:
+            config: Application configuration
+            output_dir: Directory where LaTeX files will be written
+        """
+        self.config = config
+        self.output_dir = output_dir
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    def generate_pandoc_config(self, repo_name: str) -> Path:
+        """
+        Generate pandoc defaults configuration.
+
+        The defaults are written as JSON, which pandoc reads as YAML (JSON is
+        a subset of YAML) but parses faster and needs no manual quoting.
+
+        Args:
+            repo_name: Repository name for PDF title
+
+        Returns:
+            Path to generated pandoc defaults file
+        """
+        # Get system fonts
+        system_fonts = get_system_fonts()
+
+        # Get fonts from config, fallback to system fonts
+        main_font = self.config.pdf_settings.main_font or system_fonts["main_font"]
+        sans_font = self.config.pdf_settings.sans_font or system_fonts["sans_font"]
+        mono_font = self.config.pdf_settings.mono_font or system_fonts["mono_font"]
+
+        # Get PDF settings
+        code_fontsize = self.config.pdf_settings.code_fontsize
+        fontsize = self.config.pdf_settings.fontsize
+        linespread = self.config.pdf_settings.linespread
+        parskip = self.config.pdf_settings.parskip
+        margin = self.config.pdf_settings.margin
+        highlight_style = self.config.pdf_settings.highlight_style
+
+        # Generate header.tex file first
+        header_tex_path = self.generate_latex_header(
+            repo_name, main_font, sans_font, mono_font, system_fonts
+        )
+
+        # Create pandoc defaults
+        defaults = {
+            "pdf-engine": "xelatex",
+            "pdf-engine-opts": list(PANDOC_PDF_ENGINE_OPTS),
+            "from": PANDOC_INPUT_FORMAT,
+            "highlight-style": highlight_style,
+            "include-in-header": [str(header_tex_path)],
+            "variables": {
+                "documentclass": "article",
+                "geometry": margin,
+                "CJKmainfont": main_font,
+                "CJKsansfont": sans_font,
+                "CJKmonofont": main_font,
+                "monofont": mono_font,
+                "monofontoptions": ["Scale=0.85"],
+                "colorlinks": True,
+                "linkcolor": "blue",
+                "urlcolor": "blue",
+            },
+        }
+
+        defaults_path = self.output_dir / "pandoc_defaults.json"
+        defaults_path.write_text(
+            json.dumps(defaults, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+
+        logger.info(f"Generated pandoc config: {defaults_path}")
+        return defaults_path
+
+    def generate_latex_header(
+        self,
+        repo_name: str,
+        main_font: str,
+        sans_font: str,
+        mono_font: str,
+        system_fonts: Dict[str, str],
+    ) -> Path:
+        """
+        Generate LaTeX header file (header.tex).
+
+        Args:
+            repo_name: Repository name for PDF title
+            main_font: Main document font
+            sans_font: Sans-serif font
+            mono_font: Monospace font
+            system_fonts: System fonts dictionary
+
+        Returns:
+            Path to generated header.tex file
+        """
+        # Get emoji font candidates
+        emoji_candidates = self._get_emoji_font_candidates(system_fonts)
+
+        # Generate emoji font fallback setup
+        emoji_setup_tex = self._generate_emoji_fallback_setup(emoji_candidates, mono_font)
+
+        # Get PDF settings
+        code_fontsize = self.config.pdf_settings.code_fontsize
+        linespread = self.config.pdf_settings.linespread
+        parskip = self.config.pdf_settings.parskip
+
+        # Get code block visual settings
+        code_bg = self.config.pdf_settings.code_block_bg
+        code_border = self.config.pdf_settings.code_block_border
+        code_padding = self.config.pdf_settings.code_block_padding
+
+        # Build header content
+        header_content = _LATEX_HEADER_TEMPLATE.format(
+            repo_name=repo_name,
+            linespread=linespread,
+            parskip=parskip,
+            main_font=main_font,
+            sans_font=sans_font,
+            code_fontsize=code_fontsize,
+            code_bg=code_bg,
+            code_border=code_border,
+            code_padding=code_padding,
+            emoji_setup_tex=emoji_setup_tex,
+        )
+
         header_path = self.output_dir / "header.tex"
         header_path.write_text(header_content, encoding="utf-8")
 
@@ -365,13 +387,11 @@ date: "{self._get_current_date()}"
 
     def _get_current_date(self) -> str:
         """Get current date in YYYY-MM-DD format."""
-        from datetime import datetime
-
         return datetime.now().strftime("%Y-%m-%d")
 
     def clean_temp_files(self) -> None:
         """Remove generated temporary LaTeX files."""
-        temp_files = ["header.tex", "pandoc_defaults.yaml", "metadata.yaml"]
+        temp_files = ["header.tex", "pandoc_defaults.json", "metadata.yaml"]
 
         for filename in temp_files:
             filepath = self.output_dir / filename
@@ -22,10 +22,17 @@ from repo_to_pdf.core.constants import (
     DEFAULT_PARSKIP,
     DEVICE_PRESETS,
     PANDOC_HIGHLIGHT_STYLE,
+    SVG_MAX_RASTER_WIDTH,
     VALID_FONTSIZES,
 )
 from repo_to_pdf.core.exceptions import ConfigurationError
 
+# Prefer the LibYAML-backed C loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
 
 class RepositoryConfig(BaseModel):
     """
@@ -34,6 +41,8 @@ class RepositoryConfig(BaseModel):
     Attributes:
         url: Git repository URL (HTTP/HTTPS or SSH)
         branch: Branch name to checkout (default: "main")
+        sparse_checkout: Leave paths matching plain-name ignore patterns out of
+            the working tree (default: False)
 
     Example:
         >>> repo = RepositoryConfig(
@@ -44,6 +53,10 @@ class RepositoryConfig(BaseModel):
 
     url: str = Field(..., description="Git repository URL")
     branch: str = Field(default="main", description="Branch to checkout")
+    sparse_checkout: bool = Field(
+        default=False,
+        description="Leave paths matching plain-name ignore patterns out of the working tree"
+    )
 
     @field_validator("url")
     @classmethod
@@ -91,6 +104,10 @@ class PDFSettings(BaseModel):
         code_block_strategy: Code block rendering strategy
         emoji_download: Allow downloading emoji from CDN
         max_line_length: Maximum line length before hard wrapping
+        svg_max_width: Maximum pixel width of rasterized SVG images
+        render_cache: Reuse per-file Markdown rendered by earlier runs
+        deduplicate_files: Render identical files once and stub later copies
+        parallel_processes: Render files in worker processes instead of threads
     """
 
     margin: str = Field(default=DEFAULT_MARGIN, description="Page margins")
@@ -133,6 +150,11 @@ class PDFSettings(BaseModel):
         le=500,
         description="Maximum line length before hard wrapping"
     )
+    svg_max_width: int = Field(
+        default=SVG_MAX_RASTER_WIDTH,
+        ge=200,
+        description="Maximum pixel width of rasterized SVG images"
+    )
 
     # Code block visual enhancement settings
     code_block_bg: str = Field(
@@ -148,6 +170,19 @@ class PDFSettings(BaseModel):
         description="Code block padding (LaTeX dimension, e.g., '5pt', '3mm')"
     )
 
+    render_cache: bool = Field(
+        default=True,
+        description="Reuse per-file Markdown rendered by earlier runs"
+    )
+    deduplicate_files: bool = Field(
+        default=True,
+        description="Render identical files once and stub later copies"
+    )
+    parallel_processes: bool = Field(
+        default=False,
+        description="Render files in worker processes instead of threads"
+    )
+
     include_tree: bool = Field(
         default=True,
         description="Include directory tree in output"
@@ -240,6 +275,8 @@ class AppConfig(BaseModel):
         repository: Repository configuration
         workspace_dir: Directory for cloned repositories
         output_dir: Directory for generated PDFs
+        temp_dir: Scratch directory for intermediate files (e.g. a tmpfs
+            such as /dev/shm); defaults to temp_conversion_files
         pdf_settings: PDF generation settings
         ignores: Patterns for files/directories to ignore
         device_preset: Active device preset name
@@ -259,6 +296,10 @@ class AppConfig(BaseModel):
         default="./repo-pdfs",
         description="Output directory"
     )
+    temp_dir: Optional[str] = Field(
+        default=None,
+        description="Scratch directory for intermediate files"
+    )
     pdf_settings: PDFSettings = Field(..., description="PDF settings")
     ignores: List[str] = Field(
         default_factory=lambda: list(DEFAULT_IGNORE_PATTERNS),
@@ -303,7 +344,11 @@ class AppConfig(BaseModel):
 
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                # Safe loaders named explicitly so bandit (B506) can see them
+                if yaml.__with_libyaml__:
+                    data = yaml.load(f, Loader=yaml.CSafeLoader)
+                else:
+                    data = yaml.load(f, Loader=yaml.SafeLoader)
         except yaml.YAMLError as e:
             raise ConfigurationError(
                 "Invalid YAML syntax in configuration file",
@@ -386,6 +431,16 @@ class AppConfig(BaseModel):
             output = self.project_root / output
         return output
 
+    @property
+    def temp_path(self) -> Path:
+        """Get absolute scratch directory path."""
+        if self.temp_dir is None:
+            return self.project_root / "temp_conversion_files"
+        temp = Path(self.temp_dir)
+        if not temp.is_absolute():
+            temp = self.project_root / temp
+        return temp
+
     def to_yaml(self, output_path: Union[str, Path]) -> None:
         """
         Save configuration to YAML file.
@@ -403,7 +458,13 @@ class AppConfig(BaseModel):
 
         try:
             with open(output_path, 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+                yaml.dump(
+                    data,
+                    f,
+                    Dumper=_YamlDumper,
+                    default_flow_style=False,
+                    allow_unicode=True,
+                )
         except Exception as e:
             raise ConfigurationError(
                 f"Failed to write configuration to {output_path}",
@@ -6,7 +6,7 @@ and other configuration constants to avoid hardcoding values throughout
 the codebase.
 """
 
-from typing import Dict, Set
+from typing import Dict, FrozenSet, Set, Tuple
 
 # ============================================================================
 # File Size Limits
@@ -24,6 +24,9 @@ MAX_LINES_BEFORE_SPLIT: int = 1000
 CHUNK_SIZE_LINES: int = 800
 """Number of lines per chunk when splitting large files"""
 
+BINARY_SNIFF_CHARS: int = 4096
+"""Leading characters checked for NUL to detect binary content"""
+
 # ============================================================================
 # Line and String Length Limits
 # ============================================================================
@@ -82,6 +85,18 @@ STREAM_CHUNK_SIZE: int = 8192
 CACHE_MAX_SIZE: int = 128
 """Maximum size for LRU caches"""
 
+OUTPUT_FLUSH_BYTES: int = 4 * 1024 * 1024
+"""Rendered Markdown accumulated in memory before it is written out"""
+
+DEDUP_MIN_BYTES: int = 256
+"""Files smaller than this are always rendered, even if identical to another"""
+
+RENDER_CACHE_VERSION: int = 2
+"""Version of the per-file render cache; bump when rendering output changes"""
+
+RENDER_CACHE_MAX_AGE_DAYS: int = 30
+"""Render cache entries unused for this many days are deleted after a run"""
+
 MEMORY_LIMIT_MB: int = 500
 """Target memory limit in MB"""
 
@@ -104,21 +119,34 @@ CAIROSVG_HEIGHT: int = 1200
 CAIROSVG_SCALE: float = 2.0
 """Scale factor for CairoSVG conversion (higher = better quality)"""
 
+SVG_MAX_RASTER_WIDTH: int = 2000
+"""Maximum pixel width of rasterized SVGs (a 6.5in text block at 300dpi)"""
+
 # ============================================================================
 # File Extensions
 # ============================================================================
 
-IMAGE_EXTENSIONS: Set[str] = {
+IMAGE_EXTENSIONS: FrozenSet[str] = frozenset({
     '.png', '.jpg', '.jpeg', '.gif', '.ico', '.svg', '.svgz', '.webp'
-}
+})
 """Supported image file extensions"""
 
-BINARY_EXTENSIONS: Set[str] = {
+BINARY_EXTENSIONS: FrozenSet[str] = frozenset({
     '.pyc', '.pyo', '.pyd', '.so', '.dylib', '.dll',
     '.class', '.o', '.obj', '.exe', '.bin'
-}
+})
 """Binary file extensions to ignore"""
 
+ALLOWED_HIDDEN_FILES: FrozenSet[str] = frozenset({
+    '.cursorrules', '.gitignore', '.env.example'
+})
+"""Dotfiles that are still included in the output and directory tree"""
+
+COLLECTED_HIDDEN_FILES: FrozenSet[str] = frozenset({
+    '.cursorrules', '.gitignore', '.dockerignore'
+})
+"""Dotfiles that FileProcessor.collect_files() keeps when hidden files are excluded"""
+
 CODE_EXTENSIONS: Dict[str, str] = {
     # Frontend
     '.js': 'javascript',
@@ -312,6 +340,7 @@ DEVICE_PRESETS: Dict[str, Dict] = {
             'parskip': '5pt',
             'max_file_size': '200KB',
             'max_line_length': 60,
+            'svg_max_width': 1200,
         }
     },
     'tablet': {
@@ -322,6 +351,7 @@ DEVICE_PRESETS: Dict[str, Dict] = {
             'fontsize': '9pt',
             'code_fontsize': r'\small',
             'linespread': '0.95',
+            'svg_max_width': 1800,
         }
     },
     'mobile': {
@@ -333,6 +363,7 @@ DEVICE_PRESETS: Dict[str, Dict] = {
             'code_fontsize': r'\tiny',
             'linespread': '0.85',
             'parskip': '2pt',
+            'svg_max_width': 900,
         }
     },
 }
@@ -392,3 +423,18 @@ PANDOC_HIGHLIGHT_STYLE: str = "tango"  # Changed from monochrome for better read
 
 PANDOC_PDF_ENGINE: str = "xelatex"
 """PDF engine to use with pandoc"""
+
+PANDOC_PDF_ENGINE_OPTS: Tuple[str, ...] = ("-synctex=0",)
+"""Extra command-line options passed to the PDF engine"""
+
+XELATEX_MEMORY_ENV: Dict[str, str] = {
+    'extra_mem_top': '5000000',
+    'extra_mem_bot': '5000000',
+}
+"""texmf.cnf memory overrides exported to xelatex for large documents"""
+
+PANDOC_INPUT_FORMAT: str = "markdown-yaml_metadata_block-tex_math_dollars"
+"""Pandoc reader format (code blocks and raw TeX are markdown defaults)"""
+
+PANDOC_OUTPUT_TAIL_LINES: int = 2000
+"""Number of trailing pandoc output lines kept for error reporting"""
@@ -9,7 +9,7 @@ import logging
 import os
 import shutil
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 from urllib.parse import urlparse
 
 import git
@@ -19,6 +19,36 @@ from repo_to_pdf.core.exceptions import GitOperationError
 logger = logging.getLogger(__name__)
 
 
+def _sparse_checkout_patterns(excludes: List[str]) -> List[str]:
+    """
+    Build non-cone sparse-checkout patterns that drop ignored paths.
+
+    Only plain names (no '/', wildcards or escapes, no leading '!' or '#',
+    no surrounding spaces) are translated. Git matches such a name against
+    any path component, and a path with that component always contains the
+    name as a substring, so FileProcessor.should_ignore() would drop it too.
+    Every other pattern is left to the converter's own matcher, because git
+    would match it differently and could drop files the converter keeps.
+
+    Args:
+        excludes: Ignore patterns from the configuration
+
+    Returns:
+        Patterns for ``git sparse-checkout set --no-cone``
+    """
+    patterns = ["/*"]
+    for pattern in excludes:
+        if (
+            not pattern
+            or pattern != pattern.strip()
+            or pattern[0] in "!#"
+            or any(ch in pattern for ch in "/*?[\\")
+        ):
+            continue
+        patterns.append(f"!{pattern}")
+    return patterns
+
+
 class GitRepoManager:
     """
     Manages Git repository operations.
@@ -145,18 +175,22 @@ class GitRepoManager:
         self,
         workspace_dir: Path,
         depth: int = 1,
-        single_branch: bool = True
+        single_branch: bool = True,
+        sparse_excludes: Optional[List[str]] = None
     ) -> Path:
         """
         Clone repository or pull latest changes if it exists.
 
         Uses shallow cloning with --depth=1 for better performance.
-        Implements --filter=blob:none for even faster clones.
+        Implements --filter=blob:none for even faster clones, and skips
+        tags since only the branch head is ever checked out.
 
         Args:
             workspace_dir: Directory to clone repository into
             depth: Clone depth (1 for shallow clone)
             single_branch: Whether to clone only single branch
+            sparse_excludes: Ignore patterns to leave out of the working tree
+                via sparse checkout (None checks out everything)
 
         Returns:
             Path to cloned repository
@@ -180,13 +214,16 @@ class GitRepoManager:
         try:
             if self.repo_dir.exists():
                 # Repository exists, pull latest changes
-                return self._pull_latest(self.repo_dir)
+                return self._pull_latest(
+                    self.repo_dir, depth=depth, sparse_excludes=sparse_excludes
+                )
             else:
                 # Clone repository
                 return self._clone_repository(
                     self.repo_dir,
                     depth=depth,
-                    single_branch=single_branch
+                    single_branch=single_branch,
+                    sparse_excludes=sparse_excludes
                 )
 
         except git.GitCommandError as e:
@@ -204,15 +241,21 @@ class GitRepoManager:
         self,
         target_dir: Path,
         depth: int = 1,
-        single_branch: bool = True
+        single_branch: bool = True,
+        sparse_excludes: Optional[List[str]] = None
     ) -> Path:
         """
         Clone repository with optimized settings.
 
+        With sparse_excludes the clone is made without a checkout, the
+        sparse-checkout patterns are applied, and only then is the branch
+        checked out, so ignored paths are never fetched or written.
+
         Args:
             target_dir: Directory to clone into
             depth: Clone depth
             single_branch: Whether to clone single branch
+            sparse_excludes: Ignore patterns to leave out of the working tree
 
         Returns:
             Path to cloned repository
@@ -221,16 +264,22 @@ class GitRepoManager:
 
         try:
             # Clone with optimal settings
-            git.Repo.clone_from(
+            repo = git.Repo.clone_from(
                 url=self.repo_url,
                 to_path=str(target_dir),
                 branch=self.branch,
                 depth=depth,
                 single_branch=single_branch,
+                no_tags=True,
+                no_checkout=sparse_excludes is not None,
                 # Use blob filter for faster clones
                 filter='blob:none' if depth == 1 else None
             )
 
+            if sparse_excludes is not None:
+                self._apply_sparse_checkout(repo, sparse_excludes)
+                repo.git.checkout(self.branch)
+
             logger.info(f"Successfully cloned repository to: {target_dir}")
             return target_dir
 
@@ -244,12 +293,22 @@ class GitRepoManager:
                 f"Branch: {self.branch}, Error: {e.stderr}"
             )
 
-    def _pull_latest(self, repo_dir: Path) -> Path:
+    def _pull_latest(
+        self,
+        repo_dir: Path,
+        depth: Optional[int] = 1,
+        sparse_excludes: Optional[List[str]] = None
+    ) -> Path:
         """
         Pull latest changes from remote.
 
+        Only the configured branch is fetched, and with the same depth as
+        the initial clone, so updates stay shallow.
+
         Args:
             repo_dir: Repository directory
+            depth: Fetch depth (None or 0 for full history)
+            sparse_excludes: Ignore patterns to leave out of the working tree
 
         Returns:
             Path to repository
@@ -265,8 +324,18 @@ class GitRepoManager:
 
             origin = repo.remotes.origin
 
-            # Fetch latest changes
-            origin.fetch()
+            # Fetch latest changes for the target branch only, without tags
+            refspec = f'+refs/heads/{self.branch}:refs/remotes/origin/{self.branch}'
+            if depth:
+                origin.fetch(refspec, depth=depth, no_tags=True)
+            else:
+                origin.fetch(refspec, no_tags=True)
+
+            # Keep the sparse-checkout patterns in sync with the ignores
+            if sparse_excludes is not None:
+                self._apply_sparse_checkout(repo, sparse_excludes)
+            elif repo.git.config('--get', 'core.sparseCheckout', with_exceptions=False) == 'true':
+                repo.git.sparse_checkout('disable')
 
             # Reset to remote branch
             repo.git.reset('--hard', f'origin/{self.branch}')
@@ -280,6 +349,24 @@ class GitRepoManager:
                 f"Branch: {self.branch}, Error: {e.stderr}"
             )
 
+    def _apply_sparse_checkout(self, repo: git.Repo, excludes: List[str]) -> None:
+        """
+        Restrict the working tree to paths not matched by excludes.
+
+        Failure (e.g. git older than 2.25) is logged and leaves a full
+        checkout, since the ignore patterns are still applied later.
+
+        Args:
+            repo: Repository to configure
+            excludes: Ignore patterns from the configuration
+        """
+        try:
+            repo.git.sparse_checkout(
+                'set', '--no-cone', *_sparse_checkout_patterns(excludes)
+            )
+        except git.GitCommandError as e:
+            logger.warning(f"Sparse checkout unavailable, using full checkout: {e.stderr}")
+
     def cleanup(self) -> None:
         """
         Remove cloned repository directory.
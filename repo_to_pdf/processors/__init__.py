@@ -3,9 +3,11 @@
 from repo_to_pdf.processors.code_processor import CodeProcessor
 from repo_to_pdf.processors.file_processor import FileProcessor
 from repo_to_pdf.processors.markdown_processor import MarkdownProcessor
+from repo_to_pdf.processors.render_cache import RenderCache
 
 __all__ = [
     "FileProcessor",
     "MarkdownProcessor",
     "CodeProcessor",
+    "RenderCache",
 ]
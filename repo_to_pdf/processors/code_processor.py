@@ -8,6 +8,8 @@ from typing import List, Tuple
 from repo_to_pdf.converters.emoji_handler import EmojiHandler
 from repo_to_pdf.core.config import AppConfig
 from repo_to_pdf.core.constants import (
+    BINARY_SNIFF_CHARS,
+    CODE_EXTENSIONS,
     MAX_LINES_BEFORE_SPLIT,
     CHUNK_SIZE_LINES,
     MAX_LINE_LENGTH_DEFAULT,
@@ -15,6 +17,15 @@ from repo_to_pdf.core.constants import (
 
 logger = logging.getLogger(__name__)
 
+# Quoted string literal with 100+ characters of content
+_LONG_STRING_RE = re.compile(r'["\']([^"\']{100,})["\']')
+
+# Consecutive 80-character pieces of a long string literal
+_STRING_CHUNK_RE = re.compile(r".{1,80}", re.DOTALL)
+
+# Characters str.splitlines() treats as line boundaries
+_LINE_BREAK_CHARS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+
 
 class CodeProcessor:
     """Processes code files for PDF conversion with syntax highlighting."""
@@ -72,6 +83,30 @@ class CodeProcessor:
         """
         Process code file content for PDF conversion.
 
+        See process_code_file_fragments(); this joins its output.
+
+        Args:
+            content: Code file content
+            file_extension: File extension (e.g., '.py')
+            relative_path: Relative path from repo root
+
+        Returns:
+            Formatted markdown with code blocks
+        """
+        return "".join(
+            self.process_code_file_fragments(content, file_extension, relative_path)
+        )
+
+    def process_code_file_fragments(
+        self, content: str, file_extension: str, relative_path: str
+    ) -> List[str]:
+        """
+        Process code file content into Markdown fragments.
+
+        The code is returned as separate fragments from the surrounding
+        headings and fences, so callers can write it out without first
+        concatenating the whole file into one string.
+
         Steps:
         1. Extract header comments (if enabled)
         2. Process long lines
@@ -85,7 +120,7 @@ class CodeProcessor:
             relative_path: Relative path from repo root
 
         Returns:
-            Formatted markdown with code blocks
+            Markdown fragments with code blocks
         """
         # 1. Extract header comments
         header_md = ""
@@ -113,24 +148,26 @@ class CodeProcessor:
         contains_emoji = "\\emojiimg{" in code_transformed
 
         # 5. Get language for syntax highlighting
-        from repo_to_pdf.core.constants import CODE_EXTENSIONS
-
         lang = CODE_EXTENSIONS.get(file_extension, "text")
 
-        # 6. Handle large files
-        lines = code_transformed.splitlines()
+        # 6. Handle large files. Hard wrapping left only \n line breaks, so
+        # the file has too many lines exactly when text follows the newline
+        # ending the last allowed line; no file is split just to count
+        cut = -1
+        if code_transformed.count("\n") >= MAX_LINES_BEFORE_SPLIT:
+            for _ in range(MAX_LINES_BEFORE_SPLIT):
+                cut = code_transformed.find("\n", cut + 1)
 
-        if len(lines) > MAX_LINES_BEFORE_SPLIT:
+        if cut != -1 and cut + 1 < len(code_transformed):
             if self.split_large_files:
                 # Split into parts
                 head = f"\n\n# {relative_path}\n\n" + header_md
-                parts = self._split_large_file(relative_path, lines, lang)
-                return head + parts
+                lines = code_transformed.splitlines()
+                return [head] + self._split_large_file(relative_path, lines, lang)
             else:
-                # Truncate
+                # Truncate at the cut, without splitting the file into lines
                 code_transformed = (
-                    "\n".join(lines[:MAX_LINES_BEFORE_SPLIT])
-                    + "\n\n... (文件太大，已截断)"
+                    code_transformed[:cut] + "\n\n... (文件太大，已截断)"
                 )
 
         # 7. Format output
@@ -266,23 +303,25 @@ class CodeProcessor:
         Returns:
             Content with long lines processed
         """
-        lines = []
-
-        for line in content.splitlines():
-            if len(line) <= max_length:
-                lines.append(line)
-                continue
-
-            # Check if line contains arrays
-            if "[" in line and "]" in line:
-                lines.append(self._break_array_line(line, max_length))
-            # Check if line contains long strings
-            elif '"' in line or "'" in line:
-                lines.append(self._break_long_strings(line))
-            else:
-                lines.append(line)
-
-        return "\n".join(lines)
+        # Fast path: most source files have no long lines at all, and the
+        # length check runs in C
+        if max(map(len, content.splitlines()), default=0) <= max_length:
+            return content
+
+        # Lines keep their own line breaks, so only long lines change
+        parts: List[str] = []
+        for line in content.splitlines(keepends=True):
+            body = line.rstrip(_LINE_BREAK_CHARS)
+            if len(body) > max_length:
+                # Check if line contains arrays
+                if "[" in body and "]" in body:
+                    line = self._break_array_line(body, max_length) + line[len(body):]
+                # Check if line contains long strings
+                elif '"' in body or "'" in body:
+                    line = self._break_long_strings(body) + line[len(body):]
+            parts.append(line)
+
+        return "".join(parts)
 
     def _break_array_line(self, line: str, max_length: int) -> str:
         """Break array line at commas."""
@@ -303,40 +342,44 @@ class CodeProcessor:
 
     def _break_long_strings(self, line: str) -> str:
         """Break lines with long strings."""
-        # Find long strings (100+ characters)
-        pattern = r'["\']([^"\']{100,})["\']'
+        # Nothing to break without a quote character
+        if '"' not in line and "'" not in line:
+            return line
 
-        def replacer(match: re.Match) -> str:
-            s = match.group(1)
-            indent = " " * (len(line) - len(line.lstrip()))
-            parts = [s[i : i + 80] for i in range(0, len(s), 80)]
+        continuation = "\\\n" + " " * (len(line) - len(line.lstrip()))
 
-            if len(parts) > 1:
-                quote = match.group(0)[0]  # Get original quote
-                return f'{quote}\\\n{indent}'.join(parts) + quote
-
-            return match.group(0)
+        def replacer(match: re.Match) -> str:
+            # Matches hold 100+ characters, so there are always several pieces
+            quote = match.group(0)[0]  # Get original quote
+            parts = _STRING_CHUNK_RE.findall(match.group(1))
+            return (quote + continuation).join(parts) + quote
 
-        return re.sub(pattern, replacer, line)
+        # Find long strings (100+ characters)
+        return _LONG_STRING_RE.sub(replacer, line)
 
     def _hard_wrap_lines(self, content: str) -> str:
         """Hard wrap extremely long lines to prevent overflow."""
         hard_wrap_threshold = max(40, self.max_line_length)
         wrap_width = max(40, min(160, int(self.max_line_length * 0.75)))
 
+        source_lines = content.splitlines()
+
+        # Fast path: no line to wrap, leaving only the line break normalization
+        if max(map(len, source_lines), default=0) <= hard_wrap_threshold:
+            return "\n".join(source_lines)
+
         lines = []
-        for ln in content.splitlines():
+        for ln in source_lines:
             if len(ln) > hard_wrap_threshold:
-                wrapped = "\n".join(
-                    ln[i : i + wrap_width] for i in range(0, len(ln), wrap_width)
-                )
-                lines.append(wrapped)
+                lines.extend(ln[i : i + wrap_width] for i in range(0, len(ln), wrap_width))
             else:
                 lines.append(ln)
 
         return "\n".join(lines)
 
-    def _split_large_file(self, relative_path: str, lines: List[str], lang: str) -> str:
+    def _split_large_file(
+        self, relative_path: str, lines: List[str], lang: str
+    ) -> List[str]:
         """
         Split large file into multiple parts.
 
@@ -346,7 +389,7 @@ class CodeProcessor:
             lang: Language for syntax highlighting
 
         Returns:
-            Markdown with split file parts
+            Markdown fragments with split file parts
         """
         result = []
         total_lines = len(lines)
@@ -380,7 +423,7 @@ class CodeProcessor:
                 result.append(part_content)
                 result.append("\n`````\n")
 
-        return "".join(result)
+        return result
 
     def _format_code_output(
         self,
@@ -389,7 +432,7 @@ class CodeProcessor:
         code_content: str,
         lang: str,
         contains_emoji: bool,
-    ) -> str:
+    ) -> List[str]:
         """
         Format code output with appropriate code block syntax.
 
@@ -401,13 +444,13 @@ class CodeProcessor:
             contains_emoji: Whether code contains emoji
 
         Returns:
-            Formatted markdown
+            Formatted markdown fragments
         """
         head = f"\n\n# {relative_path}\n\n" + header_md
 
         # Render with regular code blocks; inline \emojiimg will be executed
         # by the Verbatim/Highlighting environment (commandchars=\\{\\}).
-        return head + f"`````{lang}\n{code_content}\n`````\n\n"
+        return [head + f"`````{lang}\n", code_content, "\n`````\n\n"]
 
     def should_skip_file(self, content: str) -> bool:
         """
@@ -419,5 +462,9 @@ class CodeProcessor:
         Returns:
             True if file should be skipped
         """
+        # Skip binary content that merely has a text extension
+        if "\x00" in content[:BINARY_SNIFF_CHARS]:
+            return True
+
         # Skip files containing SVG (likely icon files)
         return "<svg" in content
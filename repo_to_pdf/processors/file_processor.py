@@ -7,27 +7,113 @@ best practices and performance optimizations.
 
 import fnmatch
 import logging
+import os
+import re
+import stat
 from pathlib import Path
-from typing import Iterator, List, Optional
+from typing import Iterator, List, Optional, Pattern
 
 from repo_to_pdf.core.config import AppConfig
 from repo_to_pdf.core.constants import (
     BINARY_EXTENSIONS,
+    COLLECTED_HIDDEN_FILES,
     IMAGE_EXTENSIONS,
     MAX_FILE_SIZE_BYTES,
-    STREAM_CHUNK_SIZE,
 )
 from repo_to_pdf.core.exceptions import FileProcessingError, ValidationError
 
 logger = logging.getLogger(__name__)
 
 
+class IgnoreMatcher:
+    """
+    Matches paths against configured ignore patterns.
+
+    All patterns are combined into one substring alternation, and the
+    wildcard ones into one anchored glob alternation, so a check runs at
+    most a few regex searches instead of a Python loop over every pattern.
+    FileProcessor and the stats generators share it so they agree on what
+    an ignore pattern means.
+
+    Example:
+        >>> matcher = IgnoreMatcher(['node_modules', '*.pyc'])
+        >>> matcher.matches(Path("src/node_modules/index.js"))
+        True
+        >>> matcher.matches(Path("src/cache.pyc"))
+        True
+    """
+
+    def __init__(self, patterns: List[str]):
+        """
+        Compile the ignore patterns.
+
+        Args:
+            patterns: Ignore patterns (names, path fragments or globs)
+        """
+        self._substring_re: Optional[Pattern[str]] = None
+        self._dir_re: Optional[Pattern[str]] = None
+        self._glob_re: Optional[Pattern[str]] = None
+        if patterns:
+            self._substring_re = re.compile(
+                "|".join(re.escape(pattern) for pattern in patterns)
+            )
+            self._dir_re = re.compile(
+                "|".join(re.escape(pattern.rstrip('/')) for pattern in patterns)
+            )
+            globs = [pattern for pattern in patterns if '*' in pattern]
+            if globs:
+                self._glob_re = re.compile(
+                    "|".join(fnmatch.translate(os.path.normcase(g)) for g in globs)
+                )
+
+    def matches(self, path: Path, glob_full_path: bool = False) -> bool:
+        """
+        Check if a path matches any ignore pattern.
+
+        Args:
+            path: Path to check
+            glob_full_path: Also match wildcard patterns against the whole
+                path, not just the file name
+
+        Returns:
+            True if the path is a pattern match
+        """
+        path_str = str(path)
+
+        # Directory or file name match (a file name is a substring of the path)
+        if self._substring_re and self._substring_re.search(path_str):
+            return True
+
+        # Wildcard match against the file name, or also the whole path
+        if self._glob_re:
+            if self._glob_re.match(os.path.normcase(path.name)):
+                return True
+            if glob_full_path and self._glob_re.match(os.path.normcase(path_str)):
+                return True
+
+        return False
+
+    def matches_dir(self, path: Path) -> bool:
+        """
+        Check if a directory matches any ignore pattern.
+
+        Patterns match as substrings of the path, minus any trailing slash.
+
+        Args:
+            path: Directory path to check
+
+        Returns:
+            True if the directory is a pattern match
+        """
+        return bool(self._dir_re and self._dir_re.search(str(path)))
+
+
 class FileProcessor:
     """
     Handles file operations with security and performance optimizations.
 
     This class provides methods for:
-    - Safe file reading (with streaming support for large files)
+    - Safe file reading (size-limited, single read)
     - File filtering based on ignore patterns
     - Path security validation (prevents path traversal)
     - File metadata collection
@@ -53,6 +139,7 @@ class FileProcessor:
         """
         self.config = config
         self.ignore_patterns = self._compile_ignore_patterns()
+        self._ignore_matcher = IgnoreMatcher(self.ignore_patterns)
 
     def _compile_ignore_patterns(self) -> List[str]:
         """
@@ -81,25 +168,8 @@ class FileProcessor:
             >>> processor.should_ignore(Path("src/main.py"))
             False
         """
-        path_str = str(path)
-        path_name = path.name
-
-        # Check exact matches
-        for pattern in self.ignore_patterns:
-            # Directory match
-            if pattern in path_str:
-                return True
-
-            # File name match
-            if path_name == pattern:
-                return True
-
-            # Wildcard match
-            if '*' in pattern:
-                if fnmatch.fnmatch(path_name, pattern):
-                    return True
-                if fnmatch.fnmatch(path_str, pattern):
-                    return True
+        if self._ignore_matcher.matches(path, glob_full_path=True):
+            return True
 
         # Ignore binary files
         if path.suffix in BINARY_EXTENSIONS:
@@ -149,8 +219,6 @@ class FileProcessor:
         """
         Safely read file with size limits and error handling.
 
-        For large files, uses streaming to avoid memory issues.
-
         Args:
             file_path: Path to file
             encoding: File encoding (default: utf-8)
@@ -166,18 +234,20 @@ class FileProcessor:
         Example:
             >>> content = processor.read_file_safe(Path("src/main.py"))
         """
-        if not file_path.exists():
+        # One stat() answers existence, type and size
+        try:
+            file_stat = file_path.stat()
+        except OSError:
             raise FileProcessingError(
                 f"File not found: {file_path}"
             )
 
-        if not file_path.is_file():
+        if not stat.S_ISREG(file_stat.st_mode):
             raise FileProcessingError(
                 f"Not a file: {file_path}"
             )
 
-        # Get file size
-        file_size = file_path.stat().st_size
+        file_size = file_stat.st_size
 
         # Check size limit
         max_size = max_size or MAX_FILE_SIZE_BYTES
@@ -190,13 +260,12 @@ class FileProcessor:
             )
 
         try:
-            # For large files, use streaming
-            if file_size > STREAM_CHUNK_SIZE * 10:  # > 80KB
-                return self._read_file_streaming(file_path, encoding)
-            else:
-                # For small files, read directly
-                with open(file_path, 'r', encoding=encoding) as f:
-                    return f.read()
+            # The size limit bounds memory, so read the bytes in one call and
+            # decode once; line endings are normalized as text mode would
+            content = file_path.read_bytes().decode(encoding)
+            if "\r" in content:
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
+            return content
 
         except UnicodeDecodeError as e:
             raise FileProcessingError(
@@ -214,33 +283,6 @@ class FileProcessor:
                 str(e)
             )
 
-    def _read_file_streaming(
-        self,
-        file_path: Path,
-        encoding: str = 'utf-8'
-    ) -> str:
-        """
-        Read file in chunks to avoid memory issues.
-
-        Args:
-            file_path: Path to file
-            encoding: File encoding
-
-        Returns:
-            File content as string
-        """
-        chunks = []
-        try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                while chunk := f.read(STREAM_CHUNK_SIZE):
-                    chunks.append(chunk)
-            return ''.join(chunks)
-        except Exception as e:
-            raise FileProcessingError(
-                f"Failed to stream file: {file_path}",
-                str(e)
-            )
-
     def read_file_lines(
         self,
         file_path: Path,
@@ -301,14 +343,13 @@ class FileProcessor:
             # Skip hidden files unless explicitly included
             if not include_hidden:
                 # Allow specific hidden files like .cursorrules, .gitignore
-                allowed_hidden = {'.cursorrules', '.gitignore', '.dockerignore'}
-                if file_path.name.startswith('.') and file_path.name not in allowed_hidden:
+                if file_path.name.startswith('.') and file_path.name not in COLLECTED_HIDDEN_FILES:
                     continue
 
                 # Skip files in hidden directories
                 if any(part.startswith('.') for part in file_path.parts):
                     # Exception for allowed hidden files
-                    if file_path.name not in allowed_hidden:
+                    if file_path.name not in COLLECTED_HIDDEN_FILES:
                         continue
 
             # Check if should be ignored
@@ -1,17 +1,93 @@
 """Markdown processing utilities for PDF conversion."""
 
+import html
 import logging
+import os
 import re
+import string
 from pathlib import Path
-from typing import Dict, Optional, Tuple
-
-from bs4 import BeautifulSoup
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 from repo_to_pdf.converters.image_converter import ImageConverter
 from repo_to_pdf.core.config import AppConfig
 
 logger = logging.getLogger(__name__)
 
+# Remote image URLs in inline Markdown images and HTML <img> tags
+_REMOTE_IMAGE_URL_RE = re.compile(
+    r'!\[[^\]]*\]\((https?://[^)\s"]+)'
+    r'|<img\s[^>]*?src=["\'](https?://[^"\']+)',
+    re.IGNORECASE,
+)
+
+# src/alt attributes of an <img> tag, double-, single- or un-quoted
+_IMG_ATTR_RE = re.compile(
+    r"""(?<![\w-])(src|alt)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""",
+    re.IGNORECASE,
+)
+
+# Patterns used by MarkdownProcessor, compiled once at import
+_CODE_BLOCK_TITLE_RE = re.compile(r'```(\w+)\s+title="([^"]+)"')
+_REFERENCE_DEF_RE = re.compile(r'^\[(.*?)\]:\s*(\S+)(?:\s+"(.*?)")?$', re.MULTILINE)
+_REFERENCE_IMAGE_RE = re.compile(r'!\[(.*?)\]\[(.*?)\]')
+_INLINE_IMAGE_RE = re.compile(r'!\[(.*?)\]\((.*?)(?:\s+"(.*?)")?\)')
+_HTML_IMG_TAG_RE = re.compile(r"<img\s+[^>]+>", re.IGNORECASE)
+_REMOTE_MD_IMAGE_RE = re.compile(r"!\[[^\]]*\]\((https?://[^\s)]+)(\s+\"[^\"]*\")?\)")
+_REMOTE_HTML_IMAGE_RE = re.compile(r"<img[^>]+src=\"https?://[^\"]+\"[^>]*>", re.IGNORECASE)
+_ESCAPE_U8_RE = re.compile(r"\\U([0-9A-Fa-f]{8})")
+_ESCAPE_U4_RE = re.compile(r"\\u([0-9A-Fa-f]{4})")
+_ESCAPE_CHAR_RE = re.compile(r"(?<!\\)\\([ntrabfv])")
+_YAML_DELIMITER_RE = re.compile(r"^---$", re.MULTILINE)
+
+# Lowercases ASCII letters only, so indexes into the result match the original
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def _parse_img_attrs(tag: str) -> Tuple[str, str]:
+    """
+    Extract the src and alt attributes of an <img> tag.
+
+    A regex handles the common case; BeautifulSoup is only used when no src
+    attribute is found that way.
+
+    Args:
+        tag: Complete <img ...> tag
+
+    Returns:
+        Tuple of (src, alt), empty strings when absent
+    """
+    attrs: Dict[str, str] = {}
+    for m in _IMG_ATTR_RE.finditer(tag):
+        value = next((v for v in m.group(2, 3, 4) if v is not None), "")
+        attrs.setdefault(m.group(1).lower(), html.unescape(value))
+
+    if "src" not in attrs:
+        # Imported here: BeautifulSoup is slow to import and rarely needed
+        from bs4 import BeautifulSoup
+
+        img = BeautifulSoup(tag, "html.parser").find("img")
+        if img:
+            return img.get("src", ""), img.get("alt", "")
+
+    return attrs.get("src", ""), attrs.get("alt", "")
+
+
+def _format_image(alt: str, path: str, title: Optional[str]) -> str:
+    """
+    Format a Markdown inline image, with its title when there is one.
+
+    Args:
+        alt: Alt text
+        path: Image path or URL
+        title: Optional image title
+
+    Returns:
+        Markdown image syntax
+    """
+    if title:
+        return f'![{alt}]({path} "{title}")'
+    return f"![{alt}]({path})"
+
 
 class MarkdownProcessor:
     """Processes Markdown content for PDF conversion."""
@@ -27,6 +103,12 @@ class MarkdownProcessor:
         self.config = config
         self.image_converter = image_converter
         self.max_line_length = config.pdf_settings.max_line_length
+        self._repo_index_root: Optional[Path] = None
+        self._repo_index: FrozenSet[str] = frozenset()
+
+        # Image references already resolved, keyed by (source directory,
+        # repository root, reference); misses are remembered as None
+        self._resolved_images: Dict[Tuple[Path, Path, str], Optional[Path]] = {}
 
     def process_markdown_content(
         self, content: str, source_file: Optional[Path] = None, repo_root: Optional[Path] = None
@@ -42,7 +124,8 @@ class MarkdownProcessor:
         5. Process inline SVG
         6. Escape backslash-u sequences outside code
         7. Hard-wrap long lines in code blocks
-        8. Escape YAML delimiters
+        8. Remove residual remote images
+        9. Escape YAML delimiters
 
         Args:
             content: Markdown content to process
@@ -52,41 +135,59 @@ class MarkdownProcessor:
         Returns:
             Processed markdown content
         """
+        # Each stage below only runs when its marker is present; cheap
+        # substring checks skip the regex passes for most files
         # 1. Remove code block title attributes
-        content = self._remove_code_block_titles(content)
+        if 'title="' in content:
+            content = self._remove_code_block_titles(content)
+
+        has_md_images = "![" in content
 
         # 2. Process reference-style links
-        reference_links = self._extract_reference_links(content)
-        content = self._process_reference_images(
-            content, reference_links, source_file, repo_root
+        reference_links = (
+            self._extract_reference_links(content) if has_md_images else {}
         )
 
-        # 3. Process inline images
-        content = self._process_inline_images(content, source_file, repo_root)
+        # Download all remote images up front instead of one at a time
+        self._prefetch_remote_images(content, reference_links)
+
+        if has_md_images:
+            # Reference images without a definition are left as they are
+            if reference_links:
+                content = self._process_reference_images(
+                    content, reference_links, source_file, repo_root
+                )
+
+            # 3. Process inline images
+            content = self._process_inline_images(content, source_file, repo_root)
+
+        # HTML tags are matched case-insensitively
+        lowered = content.lower()
 
         # 4. Process HTML image tags
-        content = self._process_html_images(content, source_file, repo_root)
+        if "<img" in lowered:
+            content = self._process_html_images(content, source_file, repo_root)
 
         # 5. Process inline SVG
-        content = self._process_inline_svg(content)
+        if "<svg" in lowered:
+            content = self._process_inline_svg(content)
 
-        # 6. Escape backslash-u sequences outside code blocks
-        content = self._escape_backslash_u_sequences(content)
+        # 6-7. Escape backslash-u sequences outside code blocks and hard-wrap
+        # long lines in code blocks, in one pass
+        content = self._escape_and_wrap_lines(content)
 
-        # 7. Hard-wrap long lines in code blocks
-        content = self._hard_wrap_code_blocks(content)
+        # 8. Final scrub of any remaining remote images to avoid Pandoc fetching
+        if "://" in content:
+            content = self._remove_residual_remote_images(content)
 
-        # 8. Escape YAML delimiters
+        # 9. Escape YAML delimiters last, so no later pass can leave a bare ---
         content = self._escape_yaml_delimiters(content)
 
-        # 9. Final scrub of any remaining remote images to avoid Pandoc fetching
-        content = self._remove_residual_remote_images(content)
-
         return content
 
     def _remove_code_block_titles(self, content: str) -> str:
         """Remove title attributes from code blocks."""
-        return re.sub(r'```(\w+)\s+title="([^"]+)"', r'```\1', content)
+        return _CODE_BLOCK_TITLE_RE.sub(r'```\1', content)
 
     def _extract_reference_links(self, content: str) -> Dict[str, Dict[str, Optional[str]]]:
         """
@@ -100,14 +201,41 @@ class MarkdownProcessor:
         """
         reference_links = {}
 
-        for match in re.finditer(
-            r'^\[(.*?)\]:\s*(\S+)(?:\s+"(.*?)")?$', content, re.MULTILINE
-        ):
+        # Every definition contains "]:"; without one there is nothing to scan
+        if "]:" not in content:
+            return reference_links
+
+        for match in _REFERENCE_DEF_RE.finditer(content):
             ref_id, url, title = match.groups()
             reference_links[ref_id] = {"url": url, "title": title}
 
         return reference_links
 
+    def _prefetch_remote_images(
+        self, content: str, reference_links: Dict[str, Dict[str, Optional[str]]]
+    ) -> None:
+        """
+        Collect remote image URLs and download them concurrently.
+
+        Args:
+            content: Markdown content
+            reference_links: Reference link definitions from the content
+        """
+        if "http" not in content:
+            return
+
+        urls = [
+            inline or html for inline, html in _REMOTE_IMAGE_URL_RE.findall(content)
+        ]
+        # Only reference definitions actually used by an image
+        urls.extend(
+            reference_links[ref_id]["url"]
+            for _, ref_id in _REFERENCE_IMAGE_RE.findall(content)
+            if ref_id in reference_links
+            and reference_links[ref_id]["url"].startswith(("http://", "https://"))
+        )
+        self.image_converter.prefetch_remote_images(urls)
+
     def _process_reference_images(
         self,
         content: str,
@@ -132,9 +260,7 @@ class MarkdownProcessor:
             if url.startswith(("http://", "https://")):
                 new_path = self.image_converter.download_remote_image(url)
                 if new_path:
-                    if title:
-                        return f'![{alt}]({new_path} "{title}")'
-                    return f"![{alt}]({new_path})"
+                    return _format_image(alt, new_path, title)
                 return ""
 
             # Process local SVG
@@ -142,24 +268,19 @@ class MarkdownProcessor:
                 new_path = self.image_converter.convert_image_to_png(
                     Path(url), self.config.project_root
                 )
-                if title:
-                    return f'![{alt}]({new_path} "{title}")'
-                return f"![{alt}]({new_path})"
+                return _format_image(alt, new_path, title)
 
             # Normalize other local images to temp images directory (flattened)
             img_path = self._resolve_image_path(url, source_file, repo_root)
-            if img_path and img_path.exists():
-                normalized = f"images/{img_path.name}"
-                if title:
-                    return f'![{alt}]({normalized} "{title}")'
-                return f"![{alt}]({normalized})"
+            if img_path:
+                name = self.image_converter.local_image_name(img_path, repo_root)
+                normalized = f"images/{name}"
+                return _format_image(alt, normalized, title)
 
             # Fallback: keep as-is
-            if title:
-                return f'![{alt}]({url} "{title}")'
-            return f"![{alt}]({url})"
+            return _format_image(alt, url, title)
 
-        return re.sub(r'!\[(.*?)\]\[(.*?)\]', process_ref_image, content)
+        return _REFERENCE_IMAGE_RE.sub(process_ref_image, content)
 
     def _process_inline_images(
         self, content: str, source_file: Optional[Path], repo_root: Optional[Path]
@@ -169,18 +290,13 @@ class MarkdownProcessor:
         def process_md_image(match: re.Match) -> str:
             alt = match.group(1) or ""
             path = match.group(2)
-            # title is group 3 if it exists
-            title = ""
-            if len(match.groups()) > 2 and match.group(3):
-                title = match.group(3)
+            title = match.group(3) or ""
 
             # Process remote images
             if path.startswith(("http://", "https://")):
                 new_path = self.image_converter.download_remote_image(path)
                 if new_path:
-                    if title:
-                        return f'![{alt}]({new_path} "{title}")'
-                    return f"![{alt}]({new_path})"
+                    return _format_image(alt, new_path, title)
                 return ""  # Remove if download fails
 
             # Process local SVG
@@ -190,20 +306,17 @@ class MarkdownProcessor:
                     new_path = self.image_converter.convert_image_to_png(
                         img_path, repo_root or self.config.project_root
                     )
-                    if title:
-                        return f'![{alt}]({new_path} "{title}")'
-                    return f"![{alt}]({new_path})"
+                    return _format_image(alt, new_path, title)
 
             # Process other local images (JPG, PNG, etc.)
             # Try to resolve the path for local images
             if not path.startswith(("http://", "https://")):
                 img_path = self._resolve_image_path(path, source_file, repo_root)
-                if img_path and img_path.exists():
+                if img_path:
                     # Normalize to temp images directory (flattened) to align with LaTeX \graphicspath
-                    normalized = f"images/{img_path.name}"
-                    if title:
-                        return f'![{alt}]({normalized} "{title}")'
-                    return f"![{alt}]({normalized})"
+                    name = self.image_converter.local_image_name(img_path, repo_root)
+                    normalized = f"images/{name}"
+                    return _format_image(alt, normalized, title)
                 else:
                     # Image not found locally, remove the reference to avoid Pandoc error
                     logger.warning(f"Image not found, removing reference: {path}")
@@ -211,12 +324,8 @@ class MarkdownProcessor:
 
             return match.group(0)
 
-        # Process with title
-        content = re.sub(r'!\[(.*?)\]\((.*?)\s+"(.*?)"\)', process_md_image, content)
-        # Process without title
-        content = re.sub(r'!\[(.*?)\]\((.*?)\)', process_md_image, content)
-
-        return content
+        # One pass handles images with and without a title
+        return _INLINE_IMAGE_RE.sub(process_md_image, content)
 
     def _resolve_image_path(
         self, img_path: str, source_file: Optional[Path], repo_root: Optional[Path]
@@ -235,27 +344,62 @@ class MarkdownProcessor:
         if not source_file or not repo_root:
             return None
 
+        # The same image is often referenced many times from one directory
+        key = (source_file.parent, repo_root, img_path)
+        if key in self._resolved_images:
+            return self._resolved_images[key]
+
+        resolved = self._find_image_path(img_path, source_file, repo_root)
+        self._resolved_images[key] = resolved
+        return resolved
+
+    def _find_image_path(
+        self, img_path: str, source_file: Path, repo_root: Path
+    ) -> Optional[Path]:
+        """
+        Find the file an image reference points to (see _resolve_image_path()).
+
+        Args:
+            img_path: Image path from markdown
+            source_file: Source markdown file
+            repo_root: Repository root
+
+        Returns:
+            Resolved absolute path if found, None otherwise
+        """
         # Handle absolute paths (starting with /)
         if img_path.startswith("/"):
             img_path = img_path.lstrip("/")
 
-        # Try multiple path resolution strategies
-        possible_paths = [
+        # Try multiple path resolution strategies (path, needs_resolve); when
+        # there is no ./ prefix to strip, 4 and 5 repeat 3 and 2 and are dropped
+        stripped = img_path.lstrip("./")
+        candidates = dict.fromkeys([
             # 1. Relative to source file directory
-            source_file.parent / img_path,
+            (source_file.parent / img_path, False),
             # 2. Relative to repo root
-            repo_root / img_path,
+            (repo_root / img_path, False),
             # 3. Resolved relative paths
-            (source_file.parent / img_path).resolve(),
+            (source_file.parent / img_path, True),
             # 4. Strip ./ prefix
-            (source_file.parent / img_path.lstrip("./")).resolve(),
+            (source_file.parent / stripped, True),
             # 5. From repo root without ./
-            repo_root / img_path.lstrip("./"),
-        ]
-
-        for path in possible_paths:
+            (repo_root / stripped, False),
+        ])
+
+        # Fast path: look candidates up in the repository file index
+        repo_index = self._get_repo_index(repo_root)
+        for path, needs_resolve in candidates:
+            if os.path.normpath(path) in repo_index:
+                return path.resolve() if needs_resolve else path
+
+        # Slow path: files outside the index (e.g. under .git or symlinked);
+        # candidates are resolved lazily and the first existing one wins
+        for path, needs_resolve in candidates:
             try:
-                if path.exists():
+                if needs_resolve:
+                    path = path.resolve()
+                if os.path.exists(path):
                     return path
             except Exception as e:
                 logger.debug(f"Failed to check path {path}: {e}")
@@ -263,6 +407,33 @@ class MarkdownProcessor:
         logger.warning(f"Could not resolve image path: {img_path}")
         return None
 
+    def _get_repo_index(self, repo_root: Path) -> FrozenSet[str]:
+        """
+        Get the set of normalized file paths in the repository.
+
+        The index is built with a single directory walk the first time it is
+        needed for a repository and reused for every later image lookup.
+
+        Args:
+            repo_root: Repository root
+
+        Returns:
+            Normalized paths of all files under repo_root
+        """
+        if self._repo_index_root != repo_root:
+            root = os.path.normpath(repo_root)
+            index = set()
+            for dirpath, dirnames, filenames in os.walk(root):
+                if ".git" in dirnames:
+                    dirnames.remove(".git")
+                index.update(os.path.join(dirpath, name) for name in filenames)
+
+            self._repo_index = frozenset(index)
+            self._repo_index_root = repo_root
+            logger.debug(f"Indexed {len(index)} files under {repo_root}")
+
+        return self._repo_index
+
     def _process_html_images(
         self, content: str, source_file: Optional[Path], repo_root: Optional[Path]
     ) -> str:
@@ -275,15 +446,7 @@ class MarkdownProcessor:
         """
 
         def process_html_image(match: re.Match) -> str:
-            tag = match.group(0)
-            soup = BeautifulSoup(tag, "html.parser")
-            img = soup.find("img")
-
-            if not img:
-                return tag
-
-            src = img.get("src", "")
-            alt = img.get("alt", "")
+            src, alt = _parse_img_attrs(match.group(0))
 
             if not src:
                 return ""
@@ -311,12 +474,11 @@ class MarkdownProcessor:
                 return f"![{alt}]({new_src})"
 
             # Normalize other local images to temp images directory (flattened)
-            normalized = f"images/{resolved.name}"
+            name = self.image_converter.local_image_name(resolved, repo_root)
+            normalized = f"images/{name}"
             return f"![{alt}]({normalized})"
 
-        return re.sub(
-            r"<img\s+[^>]+>", process_html_image, content, flags=re.IGNORECASE
-        )
+        return _HTML_IMG_TAG_RE.sub(process_html_image, content)
 
     def _remove_residual_remote_images(self, content: str) -> str:
         """
@@ -326,77 +488,74 @@ class MarkdownProcessor:
         can fail in restricted environments and produce broken temp files.
         """
         # Remove Markdown inline remote images: ![alt](http...)
-        content = re.sub(r"!\[[^\]]*\]\((https?://[^\s)]+)(\s+\"[^\"]*\")?\)", "", content)
+        content = _REMOTE_MD_IMAGE_RE.sub("", content)
         # Remove HTML remote images: <img src="http...">
-        content = re.sub(r"<img[^>]+src=\"https?://[^\"]+\"[^>]*>", "", content, flags=re.IGNORECASE)
+        content = _REMOTE_HTML_IMAGE_RE.sub("", content)
         return content
 
     def _process_inline_svg(self, content: str) -> str:
-        """Process inline <svg> tags."""
+        """
+        Process inline <svg> tags.
 
-        def process_svg(match: re.Match) -> str:
-            svg_content = match.group(0)
+        Tags are found with string searches on a lowercased copy; unlike a
+        non-greedy DOTALL regex, an unclosed tag does not rescan the document.
+        """
+        lowered = content.lower() if content.isascii() else content.translate(_ASCII_LOWER)
+
+        parts: List[str] = []
+        pos = 0
+        while True:
+            start = lowered.find("<svg", pos)
+            if start == -1:
+                break
+            tag_end = lowered.find(">", start + 4)
+            if tag_end == -1:
+                break
+            close = lowered.find("</svg>", tag_end + 1)
+            if close == -1:
+                break
+            end = close + len("</svg>")
+
+            svg_content = content[start:end]
+            parts.append(content[pos:start])
+            pos = end
 
             if self.image_converter.is_valid_svg(svg_content):
                 png_filename = self.image_converter.convert_svg_content_to_png(svg_content)
                 if png_filename:
                     # Inline SVGs are converted to the shared images/ cache directory
-                    return f"![](images/{png_filename})"
+                    parts.append(f"![](images/{png_filename})")
+                    continue
 
-            return match.group(0)
+            parts.append(svg_content)
 
-        return re.sub(
-            r"<svg\s*.*?>.*?</svg>", process_svg, content, flags=re.DOTALL | re.IGNORECASE
-        )
+        if not parts:
+            return content
 
-    def _escape_backslash_u_sequences(self, content: str) -> str:
-        """
-        Escape \\UXXXXXXXX, \\uXXXX, and common escape sequences outside code blocks.
+        parts.append(content[pos:])
+        return "".join(parts)
 
-        These sequences can be interpreted as LaTeX control sequences,
-        so we need to escape them to avoid errors.
-        Common escape sequences: \\n, \\t, \\r, \\a, \\b, \\f, \\v
+    def _escape_and_wrap_lines(self, content: str) -> str:
         """
-        lines = content.splitlines()
-        out = []
-        in_code = False
-        fence = None
-
-        for ln in lines:
-            if not in_code:
-                # Check if entering code block
-                m = re.match(r"^(?P<fence>```+)(?P<info>.*)$", ln)
-                if m:
-                    in_code = True
-                    fence = m.group("fence")
-                    out.append(ln)
-                    continue
-
-                # Escape Unicode sequences
-                ln = re.sub(r"\\U([0-9A-Fa-f]{8})", r"\\textbackslash{}U\\1", ln)
-                ln = re.sub(r"\\u([0-9A-Fa-f]{4})", r"\\textbackslash{}u\\1", ln)
-
-                # Escape common escape sequences (only if not already escaped)
-                # Match \n, \t, \r, \a, \b, \f, \v that are not preceded by another backslash
-                ln = re.sub(r"(?<!\\)\\([ntrabfv])", r"\\textbackslash{}\1", ln)
-
-                out.append(ln)
-            else:
-                # In code block, just append
-                out.append(ln)
-                if ln.startswith(fence):
-                    in_code = False
-                    fence = None
+        Escape backslash sequences outside code blocks and hard-wrap code lines.
 
-        return "\n".join(out)
+        Both steps follow the same code fences, so they share one pass over
+        the lines instead of splitting and joining the document twice.
 
-    def _hard_wrap_code_blocks(self, content: str) -> str:
+        Outside code blocks, \\UXXXXXXXX, \\uXXXX and common escape
+        sequences (\\n, \\t, \\r, \\a, \\b, \\f, \\v) are escaped, since
+        LaTeX would read them as control sequences. Inside fenced code
+        blocks, long lines are hard-wrapped to prevent Verbatim overflow;
+        raw LaTeX blocks are left untouched.
         """
-        Hard-wrap long lines in fenced code blocks.
+        # Fast path: without a fence or a backslash no line changes, so the
+        # loop is skipped and only line breaks are normalized
+        if "```" not in content and "\\" not in content:
+            out = content.splitlines()
+            if out and out[-1] == "":
+                out.pop()
+            return "\n".join(out)
 
-        This prevents Verbatim overflow in LaTeX.
-        """
-        lines = content.splitlines()
         out = []
         in_code = False
         fence = None
@@ -405,27 +564,40 @@ class MarkdownProcessor:
         hard_wrap_threshold = max(40, self.max_line_length)
         wrap_width = max(40, min(160, int(self.max_line_length * 0.75)))
 
-        for ln in lines:
+        for ln in content.splitlines():
             if not in_code:
-                # Check if entering code block
-                m = re.match(r"^(?P<fence>```+)(?P<info>.*)$", ln)
-                if m:
-                    info = (m.group("info") or "").strip().lower()
-                    fence = m.group("fence")
+                # Check if entering code block; string checks suffice, since
+                # most lines do not start with a backtick
+                if ln.startswith("```"):
+                    n = 3
+                    while n < len(ln) and ln[n] == "`":
+                        n += 1
+                    fence = ln[:n]
+                    info = ln[n:].strip().lower()
                     in_code = True
                     out.append(ln)
 
                     # Skip raw LaTeX blocks
                     skip_block = "{=latex}" in info or info == "latex"
-                    if skip_block:
-                        fence = fence + "|SKIP"
                     continue
 
+                # Every escape below starts with a backslash; most lines have none
+                if "\\" not in ln:
+                    out.append(ln)
+                    continue
+
+                # Escape Unicode sequences
+                ln = _ESCAPE_U8_RE.sub(r"\\textbackslash{}U\\1", ln)
+                ln = _ESCAPE_U4_RE.sub(r"\\textbackslash{}u\\1", ln)
+
+                # Escape common escape sequences (only if not already escaped)
+                # Match \n, \t, \r, \a, \b, \f, \v that are not preceded by another backslash
+                ln = _ESCAPE_CHAR_RE.sub(r"\\textbackslash{}\1", ln)
+
                 out.append(ln)
             else:
                 # Check if exiting code block
-                fence_check = fence if "SKIP" not in fence else fence.split("|")[0]
-                if ln.startswith(fence_check):
+                if ln.startswith(fence):
                     in_code = False
                     out.append(ln)
                     fence = None
@@ -436,19 +608,26 @@ class MarkdownProcessor:
                 if skip_block:
                     out.append(ln)
                 else:
-                    # Hard wrap long lines
+                    # Hard wrap long lines; the pieces go straight into out,
+                    # whose final join supplies the line breaks
                     if len(ln) > hard_wrap_threshold:
-                        wrapped = "\n".join(
+                        out.extend(
                             ln[i : i + wrap_width] for i in range(0, len(ln), wrap_width)
                         )
-                        out.append(wrapped)
                     else:
                         out.append(ln)
 
+        # One trailing empty line is dropped; callers add their own spacing
+        if out and out[-1] == "":
+            out.pop()
+
         return "\n".join(out)
 
     def _escape_yaml_delimiters(self, content: str) -> str:
         """
         Escape standalone --- lines to prevent pandoc from treating them as YAML delimiters.
         """
-        return re.sub(r"^---$", r"\\---", content, flags=re.MULTILINE)
+        # Most files contain no --- at all; a substring check skips the regex
+        if "---" not in content:
+            return content
+        return _YAML_DELIMITER_RE.sub(r"\\---", content)
@@ -0,0 +1,146 @@
+"""Persistent cache of the Markdown rendered for each repository file."""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from repo_to_pdf.core.constants import RENDER_CACHE_VERSION
+
+logger = logging.getLogger(__name__)
+
+
+class RenderCache:
+    """
+    Content-addressed on-disk cache of rendered per-file Markdown.
+
+    Entries are keyed on the file bytes, the repository-relative path, a
+    fingerprint of the active settings and RENDER_CACHE_VERSION, and are
+    stored as ``<cache_dir>/<key[:2]>/<key>.md``. A hit refreshes the
+    entry's modification time, and prune() deletes entries that have not
+    been used for a while. Deleting the cache directory clears the cache.
+
+    Example:
+        >>> cache = RenderCache(workspace / ".cache" / "render", fingerprint)
+        >>> key = cache.make_key("src/main.py", data)
+        >>> cached_path = cache.get_path(key)
+    """
+
+    def __init__(self, cache_dir: Path, settings_fingerprint: str):
+        """
+        Initialize the render cache.
+
+        Args:
+            cache_dir: Directory holding cache entries
+            settings_fingerprint: Serialized settings that affect rendering
+        """
+        self.cache_dir = cache_dir
+        self._salt = f"{RENDER_CACHE_VERSION}\0{settings_fingerprint}\0".encode("utf-8")
+
+    def make_key(self, relative_path: str, data: bytes) -> str:
+        """
+        Compute the cache key for a file.
+
+        Args:
+            relative_path: Path relative to the repository root
+            data: Raw file content
+
+        Returns:
+            Hex digest identifying the rendered output
+        """
+        digest = hashlib.sha256(self._salt)
+        digest.update(relative_path.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(data)
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        """Get the on-disk location of a cache entry."""
+        return self.cache_dir / key[:2] / f"{key}.md"
+
+    def get_path(self, key: str) -> Optional[Path]:
+        """
+        Look up rendered Markdown.
+
+        The entry is returned as a path so callers can copy the UTF-8 bytes
+        straight into their output without decoding them.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Path to the cached Markdown, or None on a miss
+        """
+        path = self._entry_path(key)
+        try:
+            # Marks the entry as used for prune(); fails if it is missing
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except OSError:
+            # Read-only cache: entries can still be used, just not marked
+            return path if path.is_file() else None
+        return path
+
+    def put(self, key: str, fragments: List[str]) -> None:
+        """
+        Store rendered Markdown.
+
+        The entry is written to a temporary file and renamed into place so
+        concurrent workers never observe a partial entry.
+
+        Args:
+            key: Cache key from make_key()
+            fragments: Rendered Markdown fragments
+        """
+        path = self._entry_path(key)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "wb") as f:
+                f.writelines(fragment.encode("utf-8") for fragment in fragments)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.debug(f"Failed to write render cache entry {key}: {e}")
+            temp_path.unlink(missing_ok=True)
+
+    def prune(self, max_age_days: int) -> int:
+        """
+        Delete entries that have not been used recently.
+
+        Also removes temporary files left behind by interrupted writes.
+
+        Args:
+            max_age_days: Age in days after which an unused entry is deleted
+
+        Returns:
+            Number of files deleted
+        """
+        cutoff = time.time() - max_age_days * 86400
+        removed = 0
+
+        try:
+            with os.scandir(self.cache_dir) as it:
+                subdirs = [entry.path for entry in it if entry.is_dir(follow_symlinks=False)]
+        except OSError:
+            return 0
+
+        for subdir in subdirs:
+            try:
+                with os.scandir(subdir) as it:
+                    for entry in it:
+                        if entry.is_file(follow_symlinks=False) and (
+                            entry.stat().st_mtime < cutoff
+                        ):
+                            os.unlink(entry.path)
+                            removed += 1
+            except OSError as e:
+                logger.debug(f"Failed to prune render cache directory {subdir}: {e}")
+
+        if removed:
+            logger.debug(f"Pruned {removed} unused render cache entries")
+        return removed
@@ -1,13 +1,54 @@
 """Code statistics generation for repository analysis."""
 
+import codecs
 import logging
+import os
 from pathlib import Path
-from typing import Callable, Dict, List
+from typing import Callable, Dict, Iterator, List
 
 from repo_to_pdf.core.constants import CODE_EXTENSIONS
+from repo_to_pdf.processors.file_processor import IgnoreMatcher
 
 logger = logging.getLogger(__name__)
 
+# Read size for counting lines; large enough that the per-chunk calls are
+# negligible next to the C-level byte counting
+_LINE_COUNT_CHUNK_SIZE = 1 << 16
+
+
+def _iter_file_entries(root: Path) -> Iterator[os.DirEntry]:
+    """
+    Walk a directory tree with os.scandir(), yielding file entries.
+
+    Directories are visited depth-first in listing order and each one's
+    files are yielded before its subdirectories are entered, matching the
+    order of Path.rglob("*"). Directory symlinks are not followed. The
+    entries' cached type and stat information saves the per-file stat()
+    calls rglob() plus Path.is_file() and Path.stat() would make.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        DirEntry for each file (including symlinks to files)
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.debug(f"Failed to list directory: {e}")
+            continue
+
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file():
+                yield entry
+        stack.extend(reversed(subdirs))
+
 
 class CodeStatsGenerator:
     """Generates code statistics for repositories."""
@@ -20,6 +61,7 @@ class CodeStatsGenerator:
             ignore_patterns: List of patterns to ignore
         """
         self.ignore_patterns = ignore_patterns
+        self._ignore_matcher = IgnoreMatcher(ignore_patterns)
 
     def generate_stats(self, repo_path: Path) -> str:
         """
@@ -53,13 +95,14 @@ class CodeStatsGenerator:
         }
 
         # Collect statistics
-        for file_path in repo_path.rglob("*"):
-            if file_path.is_file() and not self._should_ignore(file_path):
+        for entry in _iter_file_entries(repo_path):
+            file_path = Path(entry.path)
+            if not self._should_ignore(file_path):
                 stats["total_files"] += 1
 
                 # File size
                 try:
-                    size = file_path.stat().st_size
+                    size = entry.stat().st_size
                     stats["total_size"] += size
                 except Exception as e:
                     logger.debug(f"Failed to get size for {file_path}: {e}")
@@ -97,9 +140,22 @@ class CodeStatsGenerator:
         Returns:
             Number of lines, or 0 if file cannot be read
         """
+        # Counts lines as text-mode readlines() would (\n, \r\n and lone \r
+        # all end a line) without creating a string per line. The bytes are
+        # still run through a UTF-8 decoder so binary files count as 0.
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        lines = 0
+        last = b""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return len(f.readlines())
+            with open(file_path, "rb") as f:
+                while chunk := f.read(_LINE_COUNT_CHUNK_SIZE):
+                    decoder.decode(chunk)
+                    lines += chunk.count(b"\n") + chunk.count(b"\r") - chunk.count(b"\r\n")
+                    # A \r\n split across two chunks was counted twice
+                    if last == b"\r" and chunk.startswith(b"\n"):
+                        lines -= 1
+                    last = chunk[-1:]
+                decoder.decode(b"", final=True)
         except UnicodeDecodeError:
             # Binary file, skip
             return 0
@@ -107,6 +163,11 @@ class CodeStatsGenerator:
             logger.debug(f"Failed to count lines in {file_path}: {e}")
             return 0
 
+        # A last line without a line ending still counts
+        if last and last not in b"\r\n":
+            lines += 1
+        return lines
+
     def _should_ignore(self, file_path: Path) -> bool:
         """
         Check if file should be ignored.
@@ -117,19 +178,7 @@ class CodeStatsGenerator:
         Returns:
             True if file should be ignored
         """
-        import fnmatch
-
-        for pattern in self.ignore_patterns:
-            # Direct match
-            if pattern in str(file_path) or file_path.name == pattern:
-                return True
-
-            # Wildcard pattern match
-            if "*" in pattern:
-                if fnmatch.fnmatch(file_path.name, pattern):
-                    return True
-
-        return False
+        return self._ignore_matcher.matches(file_path)
 
     def _format_stats_report(self, stats: Dict) -> str:
         """
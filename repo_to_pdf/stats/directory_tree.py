@@ -1,8 +1,12 @@
 """Directory tree generation for repository visualization."""
 
 import logging
+import os
 from pathlib import Path
-from typing import Callable, List
+from typing import Callable, List, Tuple, Union
+
+from repo_to_pdf.core.constants import ALLOWED_HIDDEN_FILES
+from repo_to_pdf.processors.file_processor import IgnoreMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +24,7 @@ class DirectoryTreeGenerator:
         """
         self.ignore_patterns = ignore_patterns
         self.max_depth = max_depth
+        self._ignore_matcher = IgnoreMatcher(ignore_patterns)
 
     def generate_tree(self, repo_path: Path) -> str:
         """
@@ -42,7 +47,10 @@ class DirectoryTreeGenerator:
         self, current_path: Path, prefix: str = "", depth: int = 0
     ) -> List[str]:
         """
-        Recursively build directory tree.
+        Build directory tree depth-first.
+
+        Uses an explicit stack of pending entries rather than recursion, so
+        deep trees cost no Python frames per level.
 
         Args:
             current_path: Current directory path
@@ -52,55 +60,75 @@ class DirectoryTreeGenerator:
         Returns:
             List of tree structure lines
         """
-        if depth > self.max_depth:
-            return []
+        items: List[str] = []
+        # Pending (entry, is_last, prefix, depth) tuples, next entry on top
+        stack: List[Tuple[os.DirEntry, bool, str, int]] = []
+        self._push_entries(stack, items, current_path, prefix, depth)
+
+        while stack:
+            dir_entry, is_last, prefix, depth = stack.pop()
+            entry = Path(dir_entry.path)
+
+            # Skip hidden files/directories (except special ones)
+            if entry.name.startswith(".") and entry.name not in ALLOWED_HIDDEN_FILES:
+                continue
+
+            # Build tree symbols
+            if is_last:
+                current_prefix = "└── "
+                extension = "    "
+            else:
+                current_prefix = "├── "
+                extension = "│   "
+
+            if dir_entry.is_dir():
+                if not self._should_ignore_dir(entry):
+                    items.append(f"{prefix}{current_prefix}{entry.name}/")
+                    # Subdirectory entries go on top, so they print next
+                    self._push_entries(stack, items, entry, prefix + extension, depth + 1)
+            else:
+                # Check if file should be ignored
+                if not self._should_ignore_file(entry):
+                    # Get file size
+                    size_str = self._format_file_size(dir_entry)
+                    items.append(f"{prefix}{current_prefix}{entry.name} ({size_str})")
 
-        items = []
+        return items
 
-        try:
-            # Get all entries and sort (directories first, then files)
-            entries = sorted(
-                current_path.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower())
-            )
-
-            for i, entry in enumerate(entries):
-                is_last = i == len(entries) - 1
-
-                # Skip hidden files/directories (except special ones)
-                if entry.name.startswith(".") and entry.name not in [
-                    ".cursorrules",
-                    ".gitignore",
-                    ".env.example",
-                ]:
-                    continue
-
-                # Build tree symbols
-                if is_last:
-                    current_prefix = "└── "
-                    extension = "    "
-                else:
-                    current_prefix = "├── "
-                    extension = "│   "
-
-                if entry.is_dir():
-                    if not self._should_ignore_dir(entry):
-                        items.append(f"{prefix}{current_prefix}{entry.name}/")
-                        # Recursively process subdirectories
-                        sub_items = self._build_tree(
-                            entry, prefix + extension, depth + 1
-                        )
-                        items.extend(sub_items)
-                else:
-                    # Check if file should be ignored
-                    if not self._should_ignore_file(entry):
-                        # Get file size
-                        size_str = self._format_file_size(entry)
-                        items.append(f"{prefix}{current_prefix}{entry.name} ({size_str})")
+    def _push_entries(
+        self,
+        stack: List[Tuple[os.DirEntry, bool, str, int]],
+        items: List[str],
+        dir_path: Path,
+        prefix: str,
+        depth: int,
+    ) -> None:
+        """
+        Push a directory's entries onto the tree stack.
+
+        Args:
+            stack: Pending entry stack of _build_tree
+            items: Tree lines, for the permission-denied marker
+            dir_path: Directory to list
+            prefix: Prefix for the directory's entries
+            depth: Depth level of the directory's entries
+        """
+        if depth > self.max_depth:
+            return
 
+        try:
+            # Get all entries and sort (directories first, then files); the
+            # DirEntry type checks are cached, so each entry is stat()ed once
+            with os.scandir(dir_path) as it:
+                dir_entries = sorted(it, key=lambda x: (not x.is_dir(), x.name.lower()))
         except PermissionError:
             items.append(f"{prefix}[Permission Denied]")
+            return
 
-        return items
+        # Reversed, so the first entry ends up on top of the stack
+        last = len(dir_entries) - 1
+        for i in range(last, -1, -1):
+            stack.append((dir_entries[i], i == last, prefix, depth))
 
     def _should_ignore_dir(self, dir_path: Path) -> bool:
         """
@@ -115,16 +143,11 @@ class DirectoryTreeGenerator:
         dir_name = dir_path.name
 
         # Ignore hidden directories
-        if dir_name.startswith(".") and dir_name not in [".github"]:
+        if dir_name.startswith(".") and dir_name != ".github":
             return True
 
-        # Check against ignore patterns
-        for pattern in self.ignore_patterns:
-            pattern = pattern.rstrip("/")
-            if pattern == dir_name or pattern in str(dir_path):
-                return True
-
-        return False
+        # Check against ignore patterns (a name is a substring of the path)
+        return self._ignore_matcher.matches_dir(dir_path)
 
     def _should_ignore_file(self, file_path: Path) -> bool:
         """
@@ -136,26 +159,14 @@ class DirectoryTreeGenerator:
         Returns:
             True if file should be ignored
         """
-        import fnmatch
-
-        for pattern in self.ignore_patterns:
-            # Direct match
-            if pattern in str(file_path) or file_path.name == pattern:
-                return True
-
-            # Wildcard pattern match
-            if "*" in pattern:
-                if fnmatch.fnmatch(file_path.name, pattern):
-                    return True
-
-        return False
+        return self._ignore_matcher.matches(file_path)
 
-    def _format_file_size(self, file_path: Path) -> str:
+    def _format_file_size(self, file_path: Union[Path, os.DirEntry]) -> str:
         """
         Format file size in human-readable format.
 
         Args:
-            file_path: File path
+            file_path: File path, or a directory entry whose stat is cached
 
         Returns:
             Formatted size string (e.g., "1.5KB", "2.3MB")
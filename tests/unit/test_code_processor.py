@@ -0,0 +1,98 @@
+"""Unit tests for code processor."""
+
+import time
+
+import pytest
+
+from repo_to_pdf.converters.emoji_handler import EmojiHandler
+from repo_to_pdf.core.config import AppConfig
+from repo_to_pdf.processors.code_processor import CodeProcessor
+
+
+@pytest.fixture
+def sample_config():
+    """Create a sample configuration for testing."""
+    config_dict = {
+        'repository': {
+            'url': 'https://github.com/test/repo.git',
+            'branch': 'main'
+        },
+        'pdf_settings': {
+            'main_font': 'Arial',
+            'mono_font': 'Courier',
+            'emoji_download': False,
+            'max_line_length': 80
+        }
+    }
+    return AppConfig(**config_dict)
+
+
+@pytest.fixture
+def code_processor(sample_config, tmp_path):
+    """Create CodeProcessor instance."""
+    return CodeProcessor(sample_config, EmojiHandler(tmp_path, enable_download=False))
+
+
+class TestLongLines:
+    """Test long line breaking."""
+
+    def test_short_lines_unchanged(self, code_processor):
+        """Test that content without long lines is returned as is."""
+        content = "x = 1\r\ny = [1, 2]\n\n"
+        assert code_processor.process_long_lines(content, 20) is content
+
+    def test_array_line_broken_at_commas(self, code_processor):
+        """Test that a long array line is broken at commas."""
+        content = "a = 1\n    v = [" + ", ".join(["1000"] * 10) + "]\nb = 2\n"
+
+        result = code_processor.process_long_lines(content, 30)
+
+        lines = result.split("\n")
+        assert lines[0] == "a = 1"
+        assert lines[-2:] == ["b = 2", ""]
+        assert all(len(line) <= 30 for line in lines)
+        assert all(line.startswith("    ") for line in lines[2:-2])
+        assert "".join(lines[1:-2]).replace(" ", "") == "v=[" + ",".join(["1000"] * 10) + "]"
+
+    def test_line_break_kept_after_broken_line(self, code_processor):
+        """Test that a broken line keeps its own line ending."""
+        content = "[" + ",".join(["12345"] * 10) + "]\r\nz\r\n"
+
+        result = code_processor.process_long_lines(content, 20)
+
+        assert result.endswith("]\r\nz\r\n")
+
+    def test_near_limit_lines_are_linear(self, code_processor):
+        """Test that lines just under the limit are checked in linear time."""
+        content = "\n".join("x" * 1999 for _ in range(500))
+
+        start = time.perf_counter()
+        result = code_processor.process_long_lines(content, 2000)
+        elapsed = time.perf_counter() - start
+
+        assert result is content
+        assert elapsed < 1.0
+
+
+class TestHardWrap:
+    """Test hard wrapping of code lines."""
+
+    def test_long_line_wrapped(self, code_processor):
+        """Test that a line over the threshold is split at the wrap width."""
+        result = code_processor._hard_wrap_lines("short\n" + "y" * 130 + "\n")
+
+        # Threshold is max(40, 80) = 80; width is max(40, min(160, 60)) = 60
+        assert result.split("\n") == ["short", "y" * 60, "y" * 60, "y" * 10]
+
+    def test_line_breaks_normalized(self, code_processor):
+        """Test that content without long lines only has line breaks normalized."""
+        assert code_processor._hard_wrap_lines("a\r\nb\rc\n") == "a\nb\nc"
+
+    def test_process_code_file_wraps_output(self, code_processor):
+        """Test that long code lines are wrapped in the rendered file."""
+        content = "x = 1\n" + "z" * 150 + "\n"
+
+        result = code_processor.process_code_file(content, ".py", "src/main.py")
+
+        assert "# src/main.py" in result
+        assert "\n" + "z" * 60 + "\n" + "z" * 60 + "\n" + "z" * 30 + "\n" in result
@@ -165,6 +165,27 @@ class TestAppConfig:
         config = AppConfig(**sample_config_dict)
         assert config.output_path.is_absolute()
 
+    def test_from_yaml(self, tmp_path):
+        """Test loading configuration from a YAML file."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(
+            "repository:\n  url: https://github.com/user/repo.git\n"
+            "pdf_settings:\n  main_font: Arial\n  mono_font: Courier\n",
+            encoding="utf-8",
+        )
+
+        config = AppConfig.from_yaml(config_path)
+
+        assert config.repository.url == 'https://github.com/user/repo.git'
+
+    def test_from_yaml_rejects_python_tags(self, tmp_path):
+        """Test that YAML is loaded with a safe loader."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("repository: !!python/object/apply:os.getcwd []\n")
+
+        with pytest.raises(ConfigurationError):
+            AppConfig.from_yaml(config_path)
+
 
 class TestDevicePreset:
     """Test DevicePreset model."""
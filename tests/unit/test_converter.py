@@ -0,0 +1,193 @@
+"""Unit tests for the repository converter."""
+
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from repo_to_pdf.converter import RepoPDFConverter
+from repo_to_pdf.core.config import AppConfig
+
+
+def make_converter(tmp_path, **pdf_settings):
+    """Create a converter working in a temporary directory."""
+    config = AppConfig(
+        repository={'url': 'https://github.com/test/repo.git'},
+        workspace_dir=str(tmp_path / "workspace"),
+        output_dir=str(tmp_path / "output"),
+        temp_dir=str(tmp_path / "temp"),
+        # The default 'tmp' pattern would match the pytest directory itself
+        ignores=['node_modules'],
+        pdf_settings={'main_font': 'Arial', 'mono_font': 'Courier', **pdf_settings},
+    )
+    return RepoPDFConverter(config)
+
+
+@pytest.fixture
+def converter(tmp_path):
+    """Create a converter working in a temporary directory."""
+    return make_converter(tmp_path)
+
+
+@pytest.fixture
+def repo(converter, tmp_path):
+    """Create a repository with two different images named logo.png."""
+    repo_path = tmp_path / "repo"
+    for name in ("app", "docs"):
+        (repo_path / name).mkdir(parents=True)
+        (repo_path / name / "logo.png").write_bytes(f"{name}-png".encode())
+        (repo_path / name / "README.md").write_text("![logo](logo.png)\n")
+    converter.repo_path = repo_path
+    return repo_path
+
+
+class TestImageFlattening:
+    """Test copying repository images into the flat images directory."""
+
+    @pytest.mark.parametrize("order", [("app", "docs"), ("docs", "app")])
+    def test_same_name_images_do_not_collide(self, converter, repo, order):
+        """Test that each README shows its own logo in any processing order."""
+        for name in order:
+            converter._process_image_file(repo / name / "logo.png")
+
+        for name in ("app", "docs"):
+            readme = repo / name / "README.md"
+            rendered = converter.markdown_processor.process_markdown_content(
+                readme.read_text(), readme, repo
+            )
+            target = re.search(r"\(images/([^)]+)\)", rendered).group(1)
+            assert (converter.images_dir / target).read_bytes() == f"{name}-png".encode()
+
+    def test_name_is_stable(self, converter, repo):
+        """Test that every path to an image gives one name with its extension."""
+        name = converter.image_converter.local_image_name(repo / "app" / "logo.png", repo)
+
+        assert name.startswith("logo-") and name.endswith(".png")
+        assert name == converter.image_converter.local_image_name(
+            repo / "docs" / ".." / "app" / "logo.png", repo
+        )
+
+
+class TestDeduplication:
+    """Test rendering identical files once."""
+
+    BODY = "def handler(event):\n" + "    total = event['value'] * 2\n" * 12
+
+    def render(self, tmp_path, **pdf_settings):
+        """Render a repository holding two copies of one file."""
+        settings = {'include_tree': False, 'include_stats': False, 'render_cache': False}
+        converter = make_converter(tmp_path, **{**settings, **pdf_settings})
+        repo_path = tmp_path / "repo"
+        for rel in ("a/handler.py", "b/handler.py"):
+            (repo_path / rel).parent.mkdir(parents=True, exist_ok=True)
+            (repo_path / rel).write_text(self.BODY)
+        (repo_path / "a" / "tiny.py").write_text("x = 1\n")
+        (repo_path / "b" / "tiny.py").write_text("x = 1\n")
+        converter.repo_path = repo_path
+        return converter._generate_markdown().read_text(encoding="utf-8")
+
+    def test_identical_files_rendered_once(self, tmp_path):
+        """Test that a later copy is replaced by a stub naming the first."""
+        markdown = self.render(tmp_path)
+
+        assert markdown.count("total = event['value'] * 2") == 12
+        assert "# b/handler.py\n\n> 此文件内容与 `a/handler.py` 相同，已省略" in markdown
+
+    def test_small_files_always_rendered(self, tmp_path):
+        """Test that files under DEDUP_MIN_BYTES are not stubbed."""
+        markdown = self.render(tmp_path)
+
+        assert markdown.count("x = 1") == 2
+
+    def test_deduplication_can_be_disabled(self, tmp_path):
+        """Test that every copy is rendered when deduplication is off."""
+        markdown = self.render(tmp_path, deduplicate_files=False)
+
+        assert markdown.count("total = event['value'] * 2") == 24
+        assert "相同，已省略" not in markdown
+
+    def test_same_bytes_other_extension_rendered(self, tmp_path):
+        """Test that identical bytes rendered another way are not stubbed."""
+        (tmp_path / "repo" / "c").mkdir(parents=True)
+        (tmp_path / "repo" / "c" / "handler.md").write_text(self.BODY)
+
+        markdown = self.render(tmp_path)
+
+        assert "# c/handler.md\n\n> " not in markdown
+        assert markdown.count("total = event['value'] * 2") == 24
+
+    def test_file_read_once_for_cache_and_digest(self, tmp_path, monkeypatch):
+        """Test that hashing reuses the bytes read for the render cache key."""
+        reads = []
+        read_bytes = Path.read_bytes
+
+        def counting_read_bytes(path):
+            reads.append(path.name)
+            return read_bytes(path)
+
+        monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+        self.render(tmp_path, render_cache=True)
+
+        # One read for the cache key and digest, one by the renderer
+        assert reads.count("handler.py") == 4
+
+
+class FakePandoc:
+    """Stand-in for pandoc HTML to Markdown runs, stripping tags."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, args, input=None, **kwargs):
+        """Convert the HTML passed on stdin."""
+        self.calls += 1
+        lines = re.sub(r"<[^>]+>", "", input.decode("utf-8")).splitlines()
+        stdout = "\n\n".join(line for line in lines if line).encode("utf-8")
+        return subprocess.CompletedProcess(args, 0, stdout=stdout)
+
+
+class TestHtmlConversion:
+    """Test converting HTML files to Markdown."""
+
+    @pytest.fixture
+    def html_repo(self, converter, tmp_path):
+        """Create a repository with a template partial and a page."""
+        repo_path = tmp_path / "repo"
+        repo_path.mkdir()
+        # A partial whose <div> and <pre> are closed by another template
+        (repo_path / "header.html").write_text("<div class=\"page\"><h1>Intro</h1><pre>top")
+        (repo_path / "main.html").write_text("<h1>Intro</h1>\n<p>Body text</p>\n")
+        converter.repo_path = repo_path
+        return repo_path
+
+    def render(self, converter, path):
+        """Render one HTML file the way the file pool does."""
+        return "".join(
+            converter._process_html_file(path, path.relative_to(converter.repo_path))
+        )
+
+    def test_one_pandoc_run_per_file(self, converter, html_repo, monkeypatch):
+        """Test that each file is converted on its own."""
+        pandoc = FakePandoc()
+        monkeypatch.setattr("repo_to_pdf.converter.subprocess.run", pandoc)
+
+        header = self.render(converter, html_repo / "header.html")
+        main = self.render(converter, html_repo / "main.html")
+
+        assert pandoc.calls == 2
+        assert "Body text" in main and "Body text" not in header
+
+    @pytest.mark.skipif(shutil.which("pandoc") is None, reason="pandoc not installed")
+    def test_unclosed_container_stays_in_its_file(self, converter, html_repo):
+        """Test that an unclosed element does not swallow the next file."""
+        header = self.render(converter, html_repo / "header.html")
+        main = self.render(converter, html_repo / "main.html")
+
+        assert header.startswith("\n\n# header.html\n\n")
+        assert "Body text" not in header
+        assert main.startswith("\n\n# main.html\n\n")
+        assert "top" not in main and ":::" not in main and "```" not in main
+        # Identifiers are per file, so a repeated heading is not renumbered
+        assert "intro-1" not in main
@@ -5,7 +5,9 @@ from pathlib import Path
 import tempfile
 
 from repo_to_pdf.core.config import AppConfig
-from repo_to_pdf.processors.file_processor import FileProcessor
+from repo_to_pdf.core.constants import ALLOWED_HIDDEN_FILES, COLLECTED_HIDDEN_FILES
+from repo_to_pdf.processors.file_processor import FileProcessor, IgnoreMatcher
+from repo_to_pdf.stats import CodeStatsGenerator, DirectoryTreeGenerator
 from repo_to_pdf.core.exceptions import FileProcessingError, ValidationError
 
 
@@ -58,6 +60,48 @@ class TestIgnoreLogic:
         assert file_processor.should_ignore(path) is True
 
 
+class TestIgnoreMatcher:
+    """Test the ignore matcher shared with the stats generators."""
+
+    PATTERNS = ['node_modules', 'dist/', '*.pyc', 'docs/*.json']
+
+    def test_name_and_glob_matches(self):
+        """Test substring and file name glob matching."""
+        matcher = IgnoreMatcher(self.PATTERNS)
+        assert matcher.matches(Path("web/node_modules/x.js"))
+        assert matcher.matches(Path("src/cache.pyc"))
+        assert not matcher.matches(Path("src/main.py"))
+
+    def test_full_path_glob_is_opt_in(self):
+        """Test that wildcard patterns only match whole paths on request."""
+        matcher = IgnoreMatcher(self.PATTERNS)
+        assert not matcher.matches(Path("docs/data.json"))
+        assert matcher.matches(Path("docs/data.json"), glob_full_path=True)
+
+    def test_dir_match_strips_trailing_slash(self):
+        """Test that directory patterns match without their trailing slash."""
+        matcher = IgnoreMatcher(self.PATTERNS)
+        assert matcher.matches_dir(Path("repo/dist"))
+        assert not matcher.matches(Path("repo/dist"))
+        assert not matcher.matches_dir(Path("repo/src"))
+
+    def test_no_patterns(self):
+        """Test that an empty pattern list matches nothing."""
+        matcher = IgnoreMatcher([])
+        assert not matcher.matches(Path("anything.pyc"), glob_full_path=True)
+        assert not matcher.matches_dir(Path("node_modules"))
+
+    def test_stats_generators_agree(self):
+        """Test that the stats generators apply the same file matching."""
+        matcher = IgnoreMatcher(self.PATTERNS)
+        stats = CodeStatsGenerator(self.PATTERNS)
+        tree = DirectoryTreeGenerator(self.PATTERNS)
+        for path in ["a/node_modules/b.js", "x.pyc", "docs/data.json", "src/ok.py"]:
+            expected = matcher.matches(Path(path))
+            assert stats._should_ignore(Path(path)) is expected
+            assert tree._should_ignore_file(Path(path)) is expected
+
+
 class TestPathSafety:
     """Test path safety validation."""
 
@@ -157,6 +201,27 @@ class TestFileCollection:
         assert not any(f.name == ".hidden" for f in files)
         assert any(f.name == "visible.txt" for f in files)
 
+    def test_collect_files_keeps_allowed_hidden(self, file_processor, tmp_path):
+        """Test which dotfiles are kept when hidden files are excluded."""
+        for name in ('.cursorrules', '.dockerignore', '.gitignore', '.env.example', '.hidden'):
+            (tmp_path / name).write_text("x")
+
+        files = file_processor.collect_files(tmp_path, include_hidden=False)
+
+        # .gitignore is dropped by the '.git' ignore pattern, not as hidden
+        assert {f.name for f in files} == {'.cursorrules', '.dockerignore'}
+
+    def test_directory_tree_hidden_files(self, tmp_path):
+        """Test which dotfiles the directory tree lists."""
+        for name in ('.cursorrules', '.dockerignore', '.gitignore', '.env.example', '.hidden'):
+            (tmp_path / name).write_text("x")
+
+        tree = DirectoryTreeGenerator([]).generate_tree(tmp_path)
+
+        listed = {name for name in ALLOWED_HIDDEN_FILES | COLLECTED_HIDDEN_FILES if name in tree}
+        assert listed == {'.cursorrules', '.gitignore', '.env.example'}
+        assert '.hidden' not in tree
+
 
 class TestFileTypeDetection:
     """Test file type detection."""
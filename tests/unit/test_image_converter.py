@@ -0,0 +1,176 @@
+"""Unit tests for image converter."""
+
+import json
+
+import pytest
+
+from repo_to_pdf.converters.image_converter import ImageConverter
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, status_code=200, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.text = content.decode("utf-8", "replace")
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        """Raise for error status codes like requests does."""
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class FakeSession:
+    """Session returning queued responses and recording request headers."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        """Record the request and return the next queued response."""
+        self.requests.append((url, dict(headers or {})))
+        return self.responses.pop(0)
+
+
+def make_converter(cache_dir, session, max_raster_width=2000):
+    """Create an ImageConverter that talks to a fake session."""
+    converter = ImageConverter(cache_dir, max_raster_width=max_raster_width)
+    converter._session = session
+    return converter
+
+
+@pytest.fixture
+def fake_rasterizer(monkeypatch):
+    """Replace SVG rasterization with a stub writing a marker PNG."""
+    def convert(self, svg_content, output_path, use_inkscape_fallback=True):
+        output_path.write_bytes(f"png@{self.max_raster_width}".encode())
+        return True
+
+    monkeypatch.setattr(ImageConverter, "convert_svg_to_png", convert)
+
+
+PNG_URL = "https://example.com/logo.png"
+SVG_URL = "https://example.com/badge.svg"
+VALIDATORS = {"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+
+
+class TestRemoteImageRevalidation:
+    """Test conditional requests for images cached by earlier runs."""
+
+    def test_first_download_sends_no_validators(self, tmp_path):
+        """Test that an uncached image is fetched unconditionally."""
+        session = FakeSession(FakeResponse(
+            content=b"png-bytes", headers={"Content-Type": "image/png", **VALIDATORS}
+        ))
+        converter = make_converter(tmp_path, session)
+
+        relative_path = converter.download_remote_image(PNG_URL)
+
+        assert session.requests == [(PNG_URL, {})]
+        assert relative_path.startswith("images/") and relative_path.endswith(".png")
+        assert (tmp_path / relative_path.split("/", 1)[1]).read_bytes() == b"png-bytes"
+
+    def test_not_modified_reuses_cached_file(self, tmp_path):
+        """Test that a 304 reuses the file saved by an earlier run."""
+        first = make_converter(tmp_path, FakeSession(FakeResponse(
+            content=b"png-bytes", headers={"Content-Type": "image/png", **VALIDATORS}
+        )))
+        saved = first.download_remote_image(PNG_URL)
+
+        session = FakeSession(FakeResponse(status_code=304))
+        second = make_converter(tmp_path, session)
+
+        assert second.download_remote_image(PNG_URL) == saved
+        assert session.requests == [(PNG_URL, {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+        })]
+
+    def test_missing_cached_file_is_refetched(self, tmp_path):
+        """Test that validators are not sent when the cached file is gone."""
+        first = make_converter(tmp_path, FakeSession(FakeResponse(
+            content=b"png-bytes", headers={"Content-Type": "image/png", **VALIDATORS}
+        )))
+        saved = first.download_remote_image(PNG_URL)
+        (tmp_path / saved.split("/", 1)[1]).unlink()
+
+        session = FakeSession(FakeResponse(
+            content=b"new-bytes", headers={"Content-Type": "image/png"}
+        ))
+        make_converter(tmp_path, session).download_remote_image(PNG_URL)
+
+        assert session.requests == [(PNG_URL, {})]
+
+    def test_legacy_entry_without_width_is_not_revalidated(self, tmp_path):
+        """Test that metadata predating width-aware names is not trusted."""
+        (tmp_path / "old.png").write_bytes(b"old")
+        (tmp_path / "remote_images.json").write_text(json.dumps(
+            {SVG_URL: {"file": "old.png", "etag": '"v1"'}}
+        ))
+        session = FakeSession(FakeResponse(status_code=304))
+
+        make_converter(tmp_path, session).download_remote_image(SVG_URL)
+
+        assert session.requests == [(SVG_URL, {})]
+
+
+class TestRemoteSvgWidth:
+    """Test that rasterized remote SVGs follow the raster width limit."""
+
+    def svg_response(self):
+        """Create a response carrying an SVG with validators."""
+        return FakeResponse(
+            content=b"<svg width='10' height='10'></svg>",
+            headers={"Content-Type": "image/svg+xml", **VALIDATORS},
+        )
+
+    def test_png_name_covers_width(self, tmp_path, fake_rasterizer):
+        """Test that different width limits produce different PNGs."""
+        wide = make_converter(tmp_path, FakeSession(self.svg_response()), 2000)
+        narrow = make_converter(tmp_path, FakeSession(self.svg_response()), 900)
+
+        wide_path = wide.download_remote_image(SVG_URL)
+        narrow_path = narrow.download_remote_image(SVG_URL)
+
+        assert wide_path != narrow_path
+        assert (tmp_path / narrow_path.split("/", 1)[1]).read_bytes() == b"png@900"
+
+    def test_width_recorded_in_metadata(self, tmp_path, fake_rasterizer):
+        """Test that the raster width is stored with the validators."""
+        converter = make_converter(tmp_path, FakeSession(self.svg_response()), 1200)
+        relative_path = converter.download_remote_image(SVG_URL)
+
+        meta = json.loads((tmp_path / "remote_images.json").read_text())
+        assert list(meta.values()) == [{
+            "file": relative_path.split("/", 1)[1],
+            "max_width": 1200,
+            "etag": '"v1"',
+            "last_modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+        }]
+
+    def test_other_width_is_not_revalidated(self, tmp_path, fake_rasterizer):
+        """Test that a PNG rendered at another width is never reused by a 304."""
+        wide = make_converter(tmp_path, FakeSession(self.svg_response()), 2000)
+        wide.download_remote_image(SVG_URL)
+
+        session = FakeSession(self.svg_response())
+        relative_path = make_converter(tmp_path, session, 900).download_remote_image(SVG_URL)
+
+        assert session.requests == [(SVG_URL, {})]
+        assert (tmp_path / relative_path.split("/", 1)[1]).read_bytes() == b"png@900"
+
+    def test_same_width_revalidates(self, tmp_path, fake_rasterizer):
+        """Test that each width keeps its own validators for 304 reuse."""
+        wide = make_converter(tmp_path, FakeSession(self.svg_response()), 2000)
+        narrow = make_converter(tmp_path, FakeSession(self.svg_response()), 900)
+        wide_path = wide.download_remote_image(SVG_URL)
+        narrow.download_remote_image(SVG_URL)
+
+        session = FakeSession(FakeResponse(status_code=304))
+        converter = make_converter(tmp_path, session, 2000)
+
+        assert converter.download_remote_image(SVG_URL) == wide_path
+        assert session.requests[0][1]["If-None-Match"] == '"v1"'
@@ -0,0 +1,28 @@
+"""Unit tests for LaTeX generator."""
+
+import json
+
+from repo_to_pdf.converters.latex_generator import LaTeXGenerator
+from repo_to_pdf.core.config import AppConfig
+from repo_to_pdf.core.constants import PANDOC_INPUT_FORMAT
+
+
+class TestPandocConfig:
+    """Test the generated pandoc defaults."""
+
+    def test_input_format_pinned(self):
+        """Test that only the extensions known to break LaTeX are disabled."""
+        # citations and latex_macros stay enabled, as they always were
+        assert PANDOC_INPUT_FORMAT == "markdown-yaml_metadata_block-tex_math_dollars"
+
+    def test_defaults_use_input_format(self, tmp_path):
+        """Test that the defaults file carries the reader format."""
+        config = AppConfig(
+            repository={'url': 'https://github.com/test/repo.git'},
+            pdf_settings={'main_font': 'Arial', 'mono_font': 'Courier'},
+        )
+
+        defaults_path = LaTeXGenerator(config, tmp_path).generate_pandoc_config("repo")
+
+        defaults = json.loads(defaults_path.read_text(encoding="utf-8"))
+        assert defaults["from"] == PANDOC_INPUT_FORMAT
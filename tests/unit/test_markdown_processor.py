@@ -0,0 +1,104 @@
+"""Unit tests for Markdown processor."""
+
+import random
+import re
+
+import pytest
+
+from repo_to_pdf.converters.image_converter import ImageConverter
+from repo_to_pdf.core.config import AppConfig
+from repo_to_pdf.processors.markdown_processor import MarkdownProcessor
+
+_CODE_FENCE_RE = re.compile(r"^(?P<fence>```+)(?P<info>.*)$")
+
+
+def escape_then_wrap(content: str, max_line_length: int) -> str:
+    """Reference: the separate escape and hard-wrap passes of earlier versions."""
+    out = []
+    in_code = False
+    fence = None
+    for ln in content.splitlines():
+        if not in_code:
+            m = _CODE_FENCE_RE.match(ln)
+            if m:
+                in_code = True
+                fence = m.group("fence")
+                out.append(ln)
+                continue
+            ln = re.sub(r"\\U([0-9A-Fa-f]{8})", r"\\textbackslash{}U\\1", ln)
+            ln = re.sub(r"\\u([0-9A-Fa-f]{4})", r"\\textbackslash{}u\\1", ln)
+            ln = re.sub(r"(?<!\\)\\([ntrabfv])", r"\\textbackslash{}\1", ln)
+            out.append(ln)
+        else:
+            out.append(ln)
+            if ln.startswith(fence):
+                in_code = False
+    content = "\n".join(out)
+
+    out = []
+    in_code = False
+    skip_block = False
+    threshold = max(40, max_line_length)
+    width = max(40, min(160, int(max_line_length * 0.75)))
+    for ln in content.splitlines():
+        if not in_code:
+            m = _CODE_FENCE_RE.match(ln)
+            if m:
+                info = (m.group("info") or "").strip().lower()
+                fence = m.group("fence")
+                in_code = True
+                skip_block = "{=latex}" in info or info == "latex"
+            out.append(ln)
+        elif ln.startswith(fence):
+            in_code = False
+            out.append(ln)
+        elif not skip_block and len(ln) > threshold:
+            out.append("\n".join(ln[i : i + width] for i in range(0, len(ln), width)))
+        else:
+            out.append(ln)
+    return "\n".join(out)
+
+
+@pytest.fixture
+def markdown_processor(tmp_path):
+    """Create MarkdownProcessor instance."""
+    config = AppConfig(
+        repository={'url': 'https://github.com/test/repo.git'},
+        pdf_settings={'main_font': 'Arial', 'mono_font': 'Courier', 'max_line_length': 80},
+    )
+    return MarkdownProcessor(config, ImageConverter(tmp_path / "images"))
+
+
+class TestEscapeAndWrap:
+    """Test the fused backslash escaping and code-block wrapping pass."""
+
+    CASES = [
+        "",
+        "plain text\n",
+        "a\n\n\n",
+        "path C:\\new\\table and \\u00e9 \\U0001F600 but not \\\\n\n",
+        "```python\nprint('\\n')\n" + "x" * 130 + "\n```\nafter \\t\n",
+        "````\n```\n" + "y" * 90 + "\n````\n\\u1234\n",
+        "```latex\n" + "z" * 200 + "\n```\n",
+        "``` {=latex}\n\\newpage " + "w" * 100 + "\n```\n",
+        "```\nunterminated \\n " + "v" * 100,
+        "a\r\nb\rc\x0cd\n",
+    ]
+
+    @pytest.mark.parametrize("content", CASES)
+    def test_matches_two_pass_output(self, markdown_processor, content):
+        """Test hand-picked documents against the two-pass reference."""
+        assert markdown_processor._escape_and_wrap_lines(content) == escape_then_wrap(content, 80)
+
+    def test_matches_two_pass_output_randomized(self, markdown_processor):
+        """Test random documents built from fences, escapes and long lines."""
+        tokens = [
+            "a", " ", "\n", "\n", "\r\n", "```", "```latex", "````", "\\u00e9",
+            "\\U0001F600", "\\n", "\\\\t", "x" * 70, "\t", "\x0c", "`", "\n\n",
+        ]
+        rng = random.Random(0)
+        for _ in range(2000):
+            content = "".join(rng.choice(tokens) for _ in range(rng.randint(0, 40)))
+            assert markdown_processor._escape_and_wrap_lines(content) == escape_then_wrap(
+                content, 80
+            ), repr(content)
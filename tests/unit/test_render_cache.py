@@ -0,0 +1,114 @@
+"""Unit tests for the render cache."""
+
+import os
+import time
+
+import pytest
+
+from repo_to_pdf.processors.render_cache import RenderCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a render cache in a temporary directory."""
+    return RenderCache(tmp_path / "render", '{"fontsize": "10pt"}')
+
+
+def age_entry(path, days):
+    """Set a file's modification time the given number of days back."""
+    past = time.time() - days * 86400
+    os.utime(path, (past, past))
+
+
+class TestRenderCacheKeys:
+    """Test cache key computation."""
+
+    def test_key_is_stable(self, cache, tmp_path):
+        """Test that the same inputs give the same key across instances."""
+        other = RenderCache(tmp_path / "render", '{"fontsize": "10pt"}')
+        assert cache.make_key("src/a.py", b"x = 1") == other.make_key("src/a.py", b"x = 1")
+
+    def test_key_covers_path_content_and_settings(self, cache, tmp_path):
+        """Test that changing any input changes the key."""
+        key = cache.make_key("src/a.py", b"x = 1")
+        other_settings = RenderCache(tmp_path / "render", '{"fontsize": "11pt"}')
+
+        assert cache.make_key("src/b.py", b"x = 1") != key
+        assert cache.make_key("src/a.py", b"x = 2") != key
+        assert other_settings.make_key("src/a.py", b"x = 1") != key
+
+    def test_key_separates_path_from_content(self, cache):
+        """Test that the path/content boundary is part of the key."""
+        assert cache.make_key("a", b"bc") != cache.make_key("ab", b"c")
+
+
+class TestRenderCacheEntries:
+    """Test storing and looking up entries."""
+
+    def test_miss_then_hit(self, cache):
+        """Test that a stored entry is found with its exact bytes."""
+        key = cache.make_key("README.md", b"# Title")
+        assert cache.get_path(key) is None
+
+        cache.put(key, ["# Title\n", "正文\n"])
+
+        path = cache.get_path(key)
+        assert path is not None
+        assert path.read_bytes() == "# Title\n正文\n".encode("utf-8")
+
+    def test_put_leaves_no_temporary_files(self, cache):
+        """Test that put() renames its temporary file into place."""
+        key = cache.make_key("a.py", b"")
+        cache.put(key, ["x"])
+        cache.put(key, ["y"])
+
+        files = [p for p in cache.cache_dir.rglob("*") if p.is_file()]
+        assert files == [cache.get_path(key)]
+        assert files[0].read_text() == "y"
+
+    def test_hit_refreshes_modification_time(self, cache):
+        """Test that a hit marks the entry as recently used."""
+        key = cache.make_key("a.py", b"")
+        cache.put(key, ["x"])
+        path = cache.get_path(key)
+        age_entry(path, 10)
+
+        cache.get_path(key)
+
+        assert time.time() - path.stat().st_mtime < 60
+
+
+class TestRenderCachePrune:
+    """Test deleting unused entries."""
+
+    def test_prune_removes_only_old_entries(self, cache):
+        """Test that entries unused past the age limit are deleted."""
+        old_key = cache.make_key("old.py", b"")
+        new_key = cache.make_key("new.py", b"")
+        cache.put(old_key, ["old"])
+        cache.put(new_key, ["new"])
+        age_entry(cache.get_path(old_key), 31)
+        stale_temp = cache.cache_dir / new_key[:2] / "x.md.1.2.tmp"
+        stale_temp.write_text("partial")
+        age_entry(stale_temp, 31)
+
+        assert cache.prune(30) == 2
+
+        assert cache.get_path(old_key) is None
+        assert cache.get_path(new_key) is not None
+        assert not stale_temp.exists()
+
+    def test_recently_used_entry_survives(self, cache):
+        """Test that a hit keeps an old entry from being pruned."""
+        key = cache.make_key("a.py", b"")
+        cache.put(key, ["x"])
+        age_entry(cache.get_path(key), 31)
+
+        cache.get_path(key)
+
+        assert cache.prune(30) == 0
+        assert cache.get_path(key) is not None
+
+    def test_prune_missing_directory(self, tmp_path):
+        """Test that pruning a cache that was never written is a no-op."""
+        assert RenderCache(tmp_path / "missing", "").prune(30) == 0
@@ -0,0 +1,96 @@
+"""Unit tests for git repository manager."""
+
+import shutil
+
+import git
+import pytest
+
+from repo_to_pdf.core.config import AppConfig
+from repo_to_pdf.git.repo_manager import _sparse_checkout_patterns
+from repo_to_pdf.processors.file_processor import FileProcessor
+
+IGNORES = [
+    'node_modules',
+    'build',
+    'package-lock.json',
+    '*.pyc',
+    '*.json',
+    'src/*.py',
+    'docs/*.json',
+    'dist/',
+    '!keep.txt',
+    '# comment',
+    ' padded',
+    'file[0-9].txt',
+    'esc\\aped',
+]
+
+REPO_FILES = [
+    'README.md',
+    'package.json',
+    'package-lock.json',
+    'src/main.py',
+    'src/lib/util.py',
+    'src/cache.pyc',
+    'docs/data.json',
+    'docs/guide.md',
+    'node_modules/pkg/index.js',
+    'web/node_modules/x.js',
+    'build/out.txt',
+    'tools/build/run.sh',
+    'dist/app.js',
+    'file1.txt',
+]
+
+
+class TestSparseCheckoutPatterns:
+    """Test sparse-checkout pattern generation."""
+
+    def test_only_plain_names_emitted(self):
+        """Test that only plain names become exclude patterns."""
+        assert _sparse_checkout_patterns(IGNORES) == [
+            '/*',
+            '!node_modules',
+            '!build',
+            '!package-lock.json',
+        ]
+
+    def test_no_excludes(self):
+        """Test that no ignores keeps the whole tree."""
+        assert _sparse_checkout_patterns([]) == ['/*']
+
+    @pytest.mark.skipif(shutil.which('git') is None, reason="git not installed")
+    def test_round_trip_matches_should_ignore(self, tmp_path):
+        """Test that git only drops files the converter would ignore anyway."""
+        repo_dir = tmp_path / "repo"
+        repo = git.Repo.init(repo_dir)
+        for rel in REPO_FILES:
+            path = repo_dir / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(rel)
+        repo.git.add('--all', '--force')
+        repo.git.execute([
+            'git', '-c', 'user.name=test', '-c', 'user.email=test@example.com',
+            'commit', '-q', '-m', 'init',
+        ])
+
+        repo.git.sparse_checkout('set', '--no-cone', *_sparse_checkout_patterns(IGNORES))
+
+        processor = FileProcessor(AppConfig(
+            repository={'url': 'https://github.com/test/repo.git'},
+            pdf_settings={'main_font': 'Arial', 'mono_font': 'Courier'},
+            ignores=IGNORES,
+        ))
+        dropped = {rel for rel in REPO_FILES if not (repo_dir / rel).exists()}
+
+        # Plain-name patterns did take effect...
+        assert dropped == {
+            'package-lock.json',
+            'node_modules/pkg/index.js',
+            'web/node_modules/x.js',
+            'build/out.txt',
+            'tools/build/run.sh',
+        }
+        # ...and every dropped file is one the converter ignores too
+        for rel in dropped:
+            assert processor.should_ignore(repo_dir / rel), rel